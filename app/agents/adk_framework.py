@@ -5,10 +5,18 @@ Following the official Google ADK patterns from the documentation
 
 import os
 import asyncio
-from typing import Dict, List, Any, Optional
+import atexit
+import concurrent.futures
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Any, Optional, TypedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
-import random
+import secrets
+import aiohttp
+import orjson
 
 # Google ADK imports
 from google.adk.agents import Agent
@@ -23,6 +31,9 @@ from google.genai import types
 
 # Multi-source data aggregator
 from .multi_source_data import multi_source_aggregator
+from .tool_cache import TOOL_CACHE_TTLS, cache_key, cache_get, cache_set, singleflight
+
+logger = logging.getLogger(__name__)
 
 # Configure for Vertex AI
 os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "True"
@@ -30,8 +41,265 @@ os.environ["GOOGLE_GENAI_USE_VERTEXAI"] = "True"
 # Model constants
 MODEL_GEMINI_2_5_FLASH = "gemini-2.5-flash"
 
+# External API configuration, read once at import
+_OPENWEATHER_API_KEY = os.getenv('OPENWEATHER_API_KEY', 'demo_key')  # Free API key needed
+_TICKETMASTER_API_KEY = os.getenv('TICKETMASTER_API_KEY', 'demo_key')
+OPENWEATHER_URL = "http://api.openweathermap.org/data/2.5/weather"
+TICKETMASTER_EVENTS_URL = "https://app.ticketmaster.com/discovery/v2/events.json"
+
+# Shared HTTP client: a single aiohttp session bound to a long-lived background loop,
+# so tool calls reuse pooled keep-alive connections and cached DNS lookups
+_LOOP = asyncio.new_event_loop()
+threading.Thread(target=_LOOP.run_forever, name="adk-tools-http", daemon=True).start()
+_HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on the background loop on first use"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=600, keepalive_timeout=60)
+        )
+    return _HTTP_SESSION
+
+async def _run_on_http_loop(coro, timeout: float):
+    """Run a coroutine on the shared HTTP loop and await its result from the caller's loop"""
+    future = asyncio.run_coroutine_threadsafe(coro, _LOOP)
+    return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+
+async def close_http_session():
+    """Close the shared HTTP session on its own loop (call once on application shutdown)"""
+    async def _close():
+        global _HTTP_SESSION
+        if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+            await _HTTP_SESSION.close()
+        _HTTP_SESSION = None
+    await _run_on_http_loop(_close(), timeout=5)
+
+# How long a previous 200 body and its ETag / Last-Modified stay available for revalidation
+_CONDITIONAL_GET_STALE_SECONDS = 6 * 60 * 60
+
+async def _conditional_get_json(url: str, params: dict, timeout: Optional[aiohttp.ClientTimeout] = None):
+    """
+    GET a JSON resource on the shared session, revalidating a previously seen copy with
+    If-None-Match / If-Modified-Since. A 304 reuses the stored body.
+    Returns (status, data) where data is None unless the effective status is 200.
+    """
+    session = await _get_http_session()
+    validator_key = cache_key("conditional_get", url=url, **params)
+    stored = cache_get(validator_key)
+    
+    headers = {}
+    if stored:
+        etag, last_modified, _ = stored
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+    
+    request_kwargs = {'timeout': timeout} if timeout else {}  # None would disable the session timeout
+    async with session.get(url, params=params, headers=headers, **request_kwargs) as response:
+        if response.status == 304 and stored:
+            cache_set(validator_key, stored, _CONDITIONAL_GET_STALE_SECONDS)
+            return 200, stored[2]
+        if response.status != 200:
+            return response.status, None
+        
+        data = orjson.loads(await response.read())
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            cache_set(validator_key, (etag, last_modified, data), _CONDITIONAL_GET_STALE_SECONDS)
+        return 200, data
+
+# Shared worker pool for blocking client calls, created once instead of per tool call
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=32, thread_name_prefix="adk-tool")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+async def _run_blocking(func, *args):
+    """Run a blocking call (Amadeus, Cloud Translation) on the shared tool worker pool"""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, func, *args)
+
+# Nightly price bounds (INR, inclusive) for each hotel budget range
+HOTEL_BUDGET_BOUNDS = {
+    "budget": (0, 3000),
+    "mid-range": (3001, 7999),
+    "luxury": (8000, float("inf"))
+}
+
+# Result shapes returned by the travel tools
+class WeatherResult(TypedDict, total=False):
+    status: str
+    report: str
+    source: str
+    temperature: float
+    condition: str
+    humidity: int
+    error_message: str
+
+class TransportResult(TypedDict, total=False):
+    status: str
+    options: List[dict]
+    route: str
+    date: str
+    source: str
+    flight_count: int
+    error_message: str
+
+class AccommodationResult(TypedDict, total=False):
+    status: str
+    accommodations: List[dict]
+    city: str
+    dates: str
+    source: str
+    hotel_count: int
+    error_message: str
+
+class EventsResult(TypedDict, total=False):
+    status: str
+    events: List[dict]
+    city: str
+    theme: str
+    date: str
+    source: str
+    total_found: int
+    error_message: str
+
+# Celsius -> (value, unit suffix) converters keyed by the session's preferred temperature unit
+TEMPERATURE_CONVERTERS = {
+    "Celsius": lambda temp_c: (temp_c, "°C"),
+    "Fahrenheit": lambda temp_c: ((temp_c * 9/5) + 32, "°F")
+}
+
+# Fields a booking request must carry before it can be confirmed
+REQUIRED_BOOKING_FIELDS = ('user_info', 'payment_info')
+
+# Map themes to Ticketmaster classifications
+TICKETMASTER_CLASSIFICATIONS = {
+    "cultural": "Arts & Theatre",
+    "adventure": "Sports",
+    "spiritual": "Miscellaneous",
+    "luxury": "Arts & Theatre",
+    "music": "Music",
+    "sports": "Sports",
+    "family": "Family"
+}
+
+@dataclass(slots=True)
+class EventInfo:
+    """Compact record for a single Ticketmaster event"""
+    name: str
+    date: str
+    time: str
+    venue: str
+    location: str
+    classification: str
+    url: str
+    source: str = "Ticketmaster"
+    price_min: Optional[float] = None
+    price_max: Optional[float] = None
+    currency: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """Serialize to the dict shape returned by get_events_activities"""
+        event_dict = {
+            "name": self.name,
+            "date": self.date,
+            "time": self.time,
+            "venue": self.venue,
+            "location": self.location,
+            "classification": self.classification,
+            "url": self.url,
+            "source": self.source
+        }
+        if self.currency is not None:
+            event_dict["price_min"] = self.price_min
+            event_dict["price_max"] = self.price_max
+            event_dict["currency"] = self.currency
+        else:
+            event_dict["price"] = "Check website for pricing"
+        return event_dict
+
+def _extract_event(event: dict, city: str, theme: str, date: str) -> EventInfo:
+    """Flatten a Ticketmaster event into an EventInfo record"""
+    event_get = event.get
+    try:
+        start = event["dates"]["start"]
+        event_date = start.get('localDate', date)
+        event_time = start.get('localTime', 'TBD')
+    except (KeyError, TypeError):
+        event_date, event_time = date, 'TBD'
+    try:
+        venue = event["_embedded"]["venues"][0]
+        venue_name = venue.get('name', 'TBD')
+    except (KeyError, IndexError, TypeError):
+        venue, venue_name = None, 'TBD'
+    try:
+        location = venue["city"]["name"]
+    except (KeyError, TypeError):
+        location = city
+    try:
+        classification = event["classifications"][0]["segment"]["name"]
+    except (KeyError, IndexError, TypeError):
+        classification = theme
+    
+    event_info = EventInfo(
+        name=event_get('name', 'Unknown Event'),
+        date=event_date,
+        time=event_time,
+        venue=venue_name,
+        location=location,
+        classification=classification,
+        url=event_get('url', '')
+    )
+    
+    # Add price information if available
+    price_ranges = event_get('priceRanges')
+    if price_ranges:
+        price_range = price_ranges[0]
+        event_info.price_min = price_range.get('min', 0)
+        event_info.price_max = price_range.get('max', 0)
+        event_info.currency = price_range.get('currency', 'USD')
+    
+    return event_info
+
+class DirectToolContext:
+    """Stand-in for ToolContext when the tools are called outside an agent turn; tools only touch state"""
+    __slots__ = ('state',)
+    
+    def __init__(self, state: Optional[Dict[str, Any]] = None):
+        # Tools write into state, so each call without one gets its own
+        self.state = {} if state is None else state
+
+def _cached_tool_result(key, tool_context: ToolContext) -> Optional[dict]:
+    """Return a cached tool result and replay the state writes it made, or None on a miss"""
+    cached = cache_get(key)
+    if cached is None:
+        return None
+    result, state_delta = cached
+    tool_context.state.update(state_delta)
+    return dict(result)
+
+def _store_tool_result(tool_name: str, key, result: dict, state_delta: dict, tool_context: ToolContext) -> dict:
+    """Apply the state writes for a successful tool result and cache both together"""
+    tool_context.state.update(state_delta)
+    cache_set(key, (result, state_delta), TOOL_CACHE_TTLS[tool_name])
+    return dict(result)
+
+async def _coalesced(key, tool_context: ToolContext, fetch) -> dict:
+    """Share one upstream call between concurrent identical tool calls"""
+    result, shared = await singleflight(key, fetch)
+    if shared:
+        # The leader cached its result and state writes on success; replay them for this session
+        cached = _cached_tool_result(key, tool_context)
+        if cached is not None:
+            return cached
+        return dict(result)
+    return result
+
 # Travel planning tools following ADK patterns
-def get_weather(city: str, tool_context: ToolContext) -> dict:
+async def get_weather(city: str, tool_context: ToolContext) -> dict:
     """Retrieves the current weather report for a specified city using OpenWeatherMap API.
     
     Args:
@@ -44,102 +312,92 @@ def get_weather(city: str, tool_context: ToolContext) -> dict:
               If 'success', includes a 'report' key with weather details.
               If 'error', includes an 'error_message' key.
     """
-    print(f"[WEATHER] Tool called for city: {city}")
+    logger.info("[WEATHER] Tool called for city: %s", city)
     
     # Read temperature preference from state
     preferred_unit = tool_context.state.get("temperature_unit", "Celsius")
-    print(f"[WEATHER] Using temperature unit: {preferred_unit}")
+    logger.info("[WEATHER] Using temperature unit: %s", preferred_unit)
+    
+    weather_cache_key = cache_key("get_weather", city=city, unit=preferred_unit)
+    cached = _cached_tool_result(weather_cache_key, tool_context)
+    if cached is not None:
+        logger.info("[WEATHER] Cache hit for %s", city)
+        return cached
+    
+    return await _coalesced(weather_cache_key, tool_context,
+                            lambda: _get_weather_live(city, preferred_unit, weather_cache_key, tool_context))
+
+async def _get_weather_live(city: str, preferred_unit: str, weather_cache_key, tool_context: ToolContext) -> WeatherResult:
+    """Fetch live weather from OpenWeatherMap for get_weather"""
+    city_display = city.capitalize()
+    convert_temperature = TEMPERATURE_CONVERTERS.get(preferred_unit, TEMPERATURE_CONVERTERS["Celsius"])
     
     try:
-        import aiohttp
-        import asyncio
-        
-        # OpenWeatherMap API configuration
-        API_KEY = os.getenv('OPENWEATHER_API_KEY')  # Free API key needed
-        BASE_URL = "http://api.openweathermap.org/data/2.5/weather"
-        
         async def fetch_weather():
-            async with aiohttp.ClientSession() as session:
-                try:
-                    params = {
-                        'q': city,
-                        'appid': API_KEY,
-                        'units': 'metric'  # Always get Celsius from API
-                    }
-                    
-                    async with session.get(BASE_URL, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return data
-                        elif response.status == 401:
-                            print("[WEATHER] API key invalid")
-                            return None
-                        else:
-                            print(f"[WEATHER] API error: {response.status}")
-                            return None
-                except Exception as e:
-                    print(f"[WEATHER] API request failed: {e}")
+            try:
+                params = {
+                    'q': city,
+                    'appid': _OPENWEATHER_API_KEY,
+                    'units': 'metric'  # Always get Celsius from API
+                }
+                
+                status, data = await _conditional_get_json(OPENWEATHER_URL, params)
+                if status == 200:
+                    return data
+                elif status == 401:
+                    logger.warning("[WEATHER] API key invalid")
+                    return None
+                else:
+                    logger.error("[WEATHER] API error: %s", status)
                     return None
+            except Exception as e:
+                logger.error("[WEATHER] API request failed: %s", e)
+                return None
         
-        # Try to get real weather data (using thread pool to avoid event loop conflicts)
-        if API_KEY != 'demo_key':
+        # Try to get real weather data on the shared HTTP loop (avoids event loop conflicts)
+        if _OPENWEATHER_API_KEY != 'demo_key':
             try:
-                import concurrent.futures
-                
-                def fetch_weather_sync():
-                    # Run in a new thread with its own event loop
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        return loop.run_until_complete(fetch_weather())
-                    finally:
-                        loop.close()
+                weather_data = await _run_on_http_loop(fetch_weather(), timeout=10)  # 10 second timeout
                 
-                # Execute in thread pool to avoid event loop conflicts
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(fetch_weather_sync)
-                    weather_data = future.result(timeout=10)  # 10 second timeout
+                if weather_data:
+                    temp_c = weather_data['main']['temp']
+                    condition = weather_data['weather'][0]['description']
+                    humidity = weather_data['main']['humidity']
                     
-                    if weather_data:
-                        temp_c = weather_data['main']['temp']
-                        condition = weather_data['weather'][0]['description']
-                        humidity = weather_data['main']['humidity']
-                        
-                        # Format temperature based on preference
-                        if preferred_unit == "Fahrenheit":
-                            temp_value = (temp_c * 9/5) + 32
-                            temp_unit = "°F"
-                        else:
-                            temp_value = temp_c
-                            temp_unit = "°C"
-                        
-                        report = f"The weather in {city.capitalize()} is {condition} with a temperature of {temp_value:.0f}{temp_unit} and {humidity}% humidity."
-                        
-                        # Update state with last checked city and real data
-                        tool_context.state["last_weather_city"] = city
-                        tool_context.state["last_weather_source"] = "OpenWeatherMap API"
-                        
-                        return {
-                            "status": "success", 
-                            "report": report,
-                            "source": "live_api",
-                            "temperature": temp_value,
-                            "condition": condition,
-                            "humidity": humidity
-                        }
+                    # Format temperature based on preference
+                    temp_value, temp_unit = convert_temperature(temp_c)
+                    
+                    report = f"The weather in {city_display} is {condition} with a temperature of {temp_value:.0f}{temp_unit} and {humidity}% humidity."
+                    
+                    # Update state with last checked city and real data
+                    state_delta = {
+                        "last_weather_city": city,
+                        "last_weather_source": "OpenWeatherMap API"
+                    }
+                    
+                    return _store_tool_result("get_weather", weather_cache_key, {
+                        "status": "success", 
+                        "report": report,
+                        "source": "live_api",
+                        "temperature": temp_value,
+                        "condition": condition,
+                        "humidity": humidity
+                    }, state_delta, tool_context)
+                
+                return {"status": "error", "error_message": f"No weather data available for {city}"}
             except Exception as e:
-                print(f"[WEATHER] API execution error: {e}")
+                logger.error("[WEATHER] API execution error: %s", e)
                 return {"status": "error", "error_message": f"Weather service temporarily unavailable: {str(e)}"}
         
         # If no valid API key is configured
-        if API_KEY == 'demo_key':
+        if _OPENWEATHER_API_KEY == 'demo_key':
             return {"status": "error", "error_message": "Weather API key not configured"}
             
     except Exception as e:
-        print(f"[WEATHER] Tool error: {e}")
+        logger.error("[WEATHER] Tool error: %s", e)
         return {"status": "error", "error_message": f"Unable to fetch weather data: {str(e)}"}
 
-def get_transport_options(origin: str, destination: str, travel_date: str, tool_context: ToolContext) -> dict:
+async def get_transport_options(origin: str, destination: str, travel_date: str, tool_context: ToolContext) -> dict:
     """Provides transport options between two cities using Amadeus Flight API.
     
     Args:
@@ -151,64 +409,79 @@ def get_transport_options(origin: str, destination: str, travel_date: str, tool_
     Returns:
         dict: Transport options with prices and timings including real flight data
     """
-    print(f"[TRANSPORT] Tool called from {origin} to {destination} on {travel_date}")
+    logger.info("[TRANSPORT] Tool called from %s to %s on %s", origin, destination, travel_date)
+    
+    transport_cache_key = cache_key("get_transport_options", origin=origin, destination=destination, travel_date=travel_date)
+    cached = _cached_tool_result(transport_cache_key, tool_context)
+    if cached is not None:
+        logger.info("[TRANSPORT] Cache hit for %s to %s", origin, destination)
+        return cached
+    
+    return await _coalesced(transport_cache_key, tool_context,
+                            lambda: _get_transport_options_live(origin, destination, travel_date, transport_cache_key, tool_context))
+
+async def _get_transport_options_live(origin: str, destination: str, travel_date: str, transport_cache_key,
+                                      tool_context: ToolContext) -> TransportResult:
+    """Fetch live flight offers from Amadeus for get_transport_options"""
+    route = f"{origin} to {destination}"
     
     try:
         from .amadeus_sync import get_flight_offers_sync
         
         # Get flights using synchronous API
-        print(f"[TRANSPORT] Calling Amadeus API for flights")
-        flight_data = get_flight_offers_sync(origin, destination, travel_date)
+        logger.info("[TRANSPORT] Calling Amadeus API for flights")
+        flight_data = await _run_blocking(get_flight_offers_sync, origin, destination, travel_date)
         
         # Check if Amadeus API returned an error
         if flight_data.get('status') == 'error':
-            print(f"[TRANSPORT] Amadeus API error: {flight_data.get('error_message', 'Unknown error')}")
+            logger.error("[TRANSPORT] Amadeus API error: %s", flight_data.get('error_message', 'Unknown error'))
             return {
                 "status": "error",
                 "error_message": flight_data.get('error_message', 'Flight search service unavailable'),
-                "route": f"{origin} to {destination}",
+                "route": route,
                 "date": travel_date
             }
         
         # Extract flights from Amadeus response
         flights = flight_data.get('flights', [])
-        print(f"[TRANSPORT] Retrieved {len(flights)} flight options")
+        logger.info("[TRANSPORT] Retrieved %s flight options", len(flights))
         
         # Check if we have any flights
         if not flights or len(flights) == 0:
-            print(f"[TRANSPORT] No flights available for {origin} to {destination}")
+            logger.info("[TRANSPORT] No flights available for %s to %s", origin, destination)
             return {
                 "status": "error", 
                 "error_message": f"No flights available from {origin} to {destination} on {travel_date}",
-                "route": f"{origin} to {destination}",
+                "route": route,
                 "date": travel_date
             }
         
         # Update session state
-        tool_context.state["last_transport_search"] = f"{origin} to {destination}"
-        tool_context.state["transport_source"] = flight_data.get('source', 'Amadeus API')
+        state_delta = {
+            "last_transport_search": route,
+            "transport_source": flight_data.get('source', 'Amadeus API')
+        }
         
-        return {
+        return _store_tool_result("get_transport_options", transport_cache_key, {
             "status": "success",
             "options": flights,
-            "route": f"{origin} to {destination}",
+            "route": route,
             "date": travel_date,
             "source": flight_data.get('source', 'Amadeus API'),
             "flight_count": len(flights)
-        }
+        }, state_delta, tool_context)
             
     except Exception as e:
-        print(f"[TRANSPORT] Transport options error: {str(e)}")
-        import traceback
-        print(f"[TRANSPORT] Traceback: {traceback.format_exc()}")
+        logger.error("[TRANSPORT] Transport options error: %s", e)
+        logger.debug("[TRANSPORT] Traceback", exc_info=True)
         return {
             "status": "error",
             "error_message": f"Transport service unavailable: {str(e)}",
-            "route": f"{origin} to {destination}",
+            "route": route,
             "date": travel_date
         }
 
-def get_accommodation_options(city: str, checkin_date: str, checkout_date: str, budget_range: str, tool_context: ToolContext) -> dict:
+async def get_accommodation_options(city: str, checkin_date: str, checkout_date: str, budget_range: str, tool_context: ToolContext) -> dict:
     """Provides accommodation options in a city using Amadeus Hotel API.
     
     Args:
@@ -221,91 +494,102 @@ def get_accommodation_options(city: str, checkin_date: str, checkout_date: str,
     Returns:
         dict: Accommodation options with details from real hotel data
     """
-    print(f"[ACCOMMODATION] Tool called for {city} ({budget_range})")
+    logger.info("[ACCOMMODATION] Tool called for %s (%s)", city, budget_range)
+    
+    accommodation_cache_key = cache_key("get_accommodation_options", city=city, checkin_date=checkin_date,
+                                        checkout_date=checkout_date, budget_range=budget_range)
+    cached = _cached_tool_result(accommodation_cache_key, tool_context)
+    if cached is not None:
+        logger.info("[ACCOMMODATION] Cache hit for %s (%s)", city, budget_range)
+        return cached
+    
+    return await _coalesced(accommodation_cache_key, tool_context,
+                            lambda: _get_accommodation_options_live(city, checkin_date, checkout_date, budget_range,
+                                                                    accommodation_cache_key, tool_context))
+
+async def _get_accommodation_options_live(city: str, checkin_date: str, checkout_date: str, budget_range: str,
+                                          accommodation_cache_key, tool_context: ToolContext) -> AccommodationResult:
+    """Fetch live hotel offers from Amadeus for get_accommodation_options"""
+    dates = f"{checkin_date} to {checkout_date}"
     
     try:
+        budget_key = budget_range.lower()
         from .amadeus_sync import get_hotel_offers_sync
         
         # Get hotels using synchronous API
-        print(f"[ACCOMMODATION] Calling Amadeus API for hotels")
-        hotel_data = get_hotel_offers_sync(city)
+        logger.info("[ACCOMMODATION] Calling Amadeus API for hotels")
+        hotel_data = await _run_blocking(get_hotel_offers_sync, city)
         
         # Check if Amadeus API returned an error
         if hotel_data.get('status') == 'error':
-            print(f"[ACCOMMODATION] Amadeus API error: {hotel_data.get('error_message', 'Unknown error')}")
+            logger.error("[ACCOMMODATION] Amadeus API error: %s", hotel_data.get('error_message', 'Unknown error'))
             return {
                 "status": "error",
                 "error_message": hotel_data.get('error_message', 'Hotel search service unavailable'),
                 "city": city,
-                "dates": f"{checkin_date} to {checkout_date}"
+                "dates": dates
             }
         
         # Extract hotels from Amadeus response
         hotels = hotel_data.get('hotels', [])
-        print(f"[ACCOMMODATION] Retrieved {len(hotels)} hotel options")
+        logger.info("[ACCOMMODATION] Retrieved %s hotel options", len(hotels))
         
         # Filter hotels by budget range if we have real data
         if hotels:
-            filtered_hotels = []
-            for hotel in hotels:
-                price = hotel.get('price_per_night', 0)
-                
-                # Filter by budget range
-                if budget_range.lower() == "budget" and price <= 3000:
-                    filtered_hotels.append(hotel)
-                elif budget_range.lower() == "luxury" and price >= 8000:
-                    filtered_hotels.append(hotel)
-                elif budget_range.lower() == "mid-range" and 3000 < price < 8000:
-                    filtered_hotels.append(hotel)
-                elif budget_range.lower() not in ["budget", "luxury", "mid-range"]:
-                    # If budget_range is not recognized, include all hotels
-                    filtered_hotels.append(hotel)
+            bounds = HOTEL_BUDGET_BOUNDS.get(budget_key)
+            if bounds:
+                low, high = bounds
+                filtered_hotels = [hotel for hotel in hotels if low <= hotel.get('price_per_night', 0) <= high]
+            else:
+                # If budget_range is not recognized, include all hotels
+                filtered_hotels = list(hotels)
             
             # If no hotels match budget filter, take first few hotels
             if not filtered_hotels:
                 filtered_hotels = hotels[:3]
             
             accommodations = filtered_hotels
-            print(f"[ACCOMMODATION] Filtered to {len(accommodations)} hotels matching {budget_range} budget")
+            logger.info("[ACCOMMODATION] Filtered to %s hotels matching %s budget", len(accommodations), budget_range)
         else:
-            print("[ACCOMMODATION] No hotels returned from API")
+            logger.info("[ACCOMMODATION] No hotels returned from API")
             accommodations = []
         
         # Check if we have any hotels to return
         if not accommodations or len(accommodations) == 0:
-            print(f"[ACCOMMODATION] No hotels available in {city}")
+            logger.info("[ACCOMMODATION] No hotels available in %s", city)
             return {
                 "status": "error", 
                 "error_message": f"No hotels available in {city} for the selected dates and budget",
                 "city": city,
-                "dates": f"{checkin_date} to {checkout_date}"
+                "dates": dates
             }
         
         # Update session state
-        tool_context.state["last_accommodation_search"] = city
-        tool_context.state["accommodation_source"] = hotel_data.get('source', 'Hotel API')
+        state_delta = {
+            "last_accommodation_search": city,
+            "accommodation_source": hotel_data.get('source', 'Hotel API')
+        }
         
-        return {
+        return _store_tool_result("get_accommodation_options", accommodation_cache_key, {
             "status": "success",
             "accommodations": accommodations,
             "city": city,
-            "dates": f"{checkin_date} to {checkout_date}",
+            "dates": dates,
             "source": hotel_data.get('source', 'Hotel API'),
             "hotel_count": len(accommodations)
-        }
+        }, state_delta, tool_context)
             
     except Exception as e:
-        print(f"[ACCOMMODATION] Accommodation options error: {str(e)}")
-        import traceback
-        print(f"[ACCOMMODATION] Traceback: {traceback.format_exc()}")
+        logger.error("[ACCOMMODATION] Accommodation options error: %s", e)
+        logger.debug("[ACCOMMODATION] Traceback", exc_info=True)
         return {
             "status": "error",
             "error_message": f"Accommodation service unavailable: {str(e)}",
             "city": city,
-            "dates": f"{checkin_date} to {checkout_date}"
+            "dates": dates
         }
 
-def get_events_activities(city: str, date: str, theme: str, tool_context: ToolContext) -> dict:
+async def get_events_activities(city: str, date: str, theme: str, tool_context: ToolContext) -> dict:
     """Provides events and activities in a city based on theme using Ticketmaster Discovery API.
     
     Args:
@@ -317,128 +601,92 @@ def get_events_activities(city: str, date: str, theme: str, tool_context: ToolCo
     Returns:
         dict: Events and activities matching the theme
     """
-    print(f"[EVENTS] Tool called for {city} with theme {theme}")
+    logger.info("[EVENTS] Tool called for %s with theme %s", city, theme)
     
+    events_cache_key = cache_key("get_events_activities", city=city, date=date, theme=theme)
+    cached = _cached_tool_result(events_cache_key, tool_context)
+    if cached is not None:
+        logger.info("[EVENTS] Cache hit for %s (%s)", city, theme)
+        return cached
+    
+    return await _coalesced(events_cache_key, tool_context,
+                            lambda: _get_events_activities_live(city, date, theme, events_cache_key, tool_context))
+
+async def _get_events_activities_live(city: str, date: str, theme: str, events_cache_key, tool_context: ToolContext) -> EventsResult:
+    """Fetch live events from Ticketmaster for get_events_activities"""
     try:
-        import aiohttp
-        import asyncio
-        from datetime import datetime
-        
-        # Ticketmaster Discovery API configuration
-        API_KEY = os.getenv('TICKETMASTER_API_KEY')
-        BASE_URL = "https://app.ticketmaster.com/discovery/v2/events.json"
+        classification = TICKETMASTER_CLASSIFICATIONS.get(theme.lower(), "Music")
         
         async def fetch_ticketmaster_events():
-            async with aiohttp.ClientSession() as session:
-                try:
-                    # Map themes to Ticketmaster classifications
-                    classification_mapping = {
-                        "cultural": "Arts & Theatre",
-                        "adventure": "Sports", 
-                        "spiritual": "Miscellaneous",
-                        "luxury": "Arts & Theatre",
-                        "music": "Music",
-                        "sports": "Sports",
-                        "family": "Family"
-                    }
-                    
-                    classification = classification_mapping.get(theme.lower(), "Music")
-                    
-                    params = {
-                        'apikey': API_KEY,
-                        'city': city,
-                        'classificationName': classification,
-                        'size': 10,  # Get top 10 events
-                        'sort': 'date,asc'
-                    }
-                    
-                    # Add date filter if provided
-                    if date and date != "":
-                        try:
-                            # Try to parse and format date for API
-                            if len(date) == 10:  # YYYY-MM-DD format
-                                params['startDateTime'] = f"{date}T00:00:00Z"
-                                params['endDateTime'] = f"{date}T23:59:59Z"
-                        except:
-                            pass  # Continue without date filter if parsing fails
-                    
-                    async with session.get(BASE_URL, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return data
-                        elif response.status == 401:
-                            print("[EVENTS] Ticketmaster API key invalid")
-                            return None
-                        else:
-                            print(f"[EVENTS] Ticketmaster API error: {response.status}")
-                            return None
-                except Exception as e:
-                    print(f"[EVENTS] Ticketmaster API request failed: {e}")
-                    return None
-        
-        # Try to get real events data from Ticketmaster (using thread pool to avoid event loop conflicts)
-        if API_KEY and API_KEY != 'demo_key':
             try:
-                import concurrent.futures
+                params = {
+                    'apikey': _TICKETMASTER_API_KEY,
+                    'city': city,
+                    'classificationName': classification,
+                    'size': 10,  # Get top 10 events
+                    'sort': 'date,asc'
+                }
                 
-                def fetch_events_sync():
-                    # Run in a new thread with its own event loop
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
+                # Add date filter if provided
+                if date and date != "":
                     try:
-                        return loop.run_until_complete(fetch_ticketmaster_events())
-                    finally:
-                        loop.close()
+                        # Try to parse and format date for API
+                        if len(date) == 10:  # YYYY-MM-DD format
+                            params['startDateTime'] = f"{date}T00:00:00Z"
+                            params['endDateTime'] = f"{date}T23:59:59Z"
+                    except:
+                        pass  # Continue without date filter if parsing fails
                 
-                # Execute in thread pool to avoid event loop conflicts
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    future = executor.submit(fetch_events_sync)
-                    events_data = future.result(timeout=30)  # 30 second timeout
+                status, data = await _conditional_get_json(TICKETMASTER_EVENTS_URL, params,
+                                                           timeout=aiohttp.ClientTimeout(total=30))
+                if status == 200:
+                    return data
+                elif status == 401:
+                    logger.warning("[EVENTS] Ticketmaster API key invalid")
+                    return None
+                else:
+                    logger.error("[EVENTS] Ticketmaster API error: %s", status)
+                    return None
+            except Exception as e:
+                logger.error("[EVENTS] Ticketmaster API request failed: %s", e)
+                return None
+        
+        # Try to get real events data from Ticketmaster on the shared HTTP loop (avoids event loop conflicts)
+        if _TICKETMASTER_API_KEY != 'demo_key':
+            try:
+                events_data = await _run_on_http_loop(fetch_ticketmaster_events(), timeout=30)  # 30 second timeout
+                
+                if events_data and '_embedded' in events_data and 'events' in events_data['_embedded']:
+                    ticketmaster_events = events_data['_embedded']['events']
+                    
+                    # Process Ticketmaster events (top 5)
+                    processed_events = [_extract_event(event, city, theme, date).to_dict() for event in ticketmaster_events[:5]]
                     
-                    if events_data and '_embedded' in events_data and 'events' in events_data['_embedded']:
-                        ticketmaster_events = events_data['_embedded']['events']
-                        
-                        # Process Ticketmaster events
-                        processed_events = []
-                        for event in ticketmaster_events[:5]:  # Top 5 events
-                            event_info = {
-                                "name": event.get('name', 'Unknown Event'),
-                                "date": event.get('dates', {}).get('start', {}).get('localDate', date),
-                                "time": event.get('dates', {}).get('start', {}).get('localTime', 'TBD'),
-                                "venue": event.get('_embedded', {}).get('venues', [{}])[0].get('name', 'TBD'),
-                                "location": event.get('_embedded', {}).get('venues', [{}])[0].get('city', {}).get('name', city),
-                                "classification": event.get('classifications', [{}])[0].get('segment', {}).get('name', theme),
-                                "url": event.get('url', ''),
-                                "source": "Ticketmaster"
-                            }
-                            
-                            # Add price information if available
-                            if 'priceRanges' in event:
-                                price_range = event['priceRanges'][0]
-                                event_info["price_min"] = price_range.get('min', 0)
-                                event_info["price_max"] = price_range.get('max', 0)
-                                event_info["currency"] = price_range.get('currency', 'USD')
-                            else:
-                                event_info["price"] = "Check website for pricing"
-                            
-                            processed_events.append(event_info)
-                        
-                        # Update state with real data
-                        tool_context.state["last_events_city"] = city
-                        tool_context.state["last_events_source"] = "Ticketmaster API"
-                        tool_context.state["events_api_used"] = True
-                        
-                        return {
-                            "status": "success",
-                            "events": processed_events,
-                            "city": city,
-                            "theme": theme,
-                            "date": date,
-                            "source": "ticketmaster_api",
-                            "total_found": len(ticketmaster_events)
-                        }
+                    # Update state with real data
+                    state_delta = {
+                        "last_events_city": city,
+                        "last_events_source": "Ticketmaster API",
+                        "events_api_used": True
+                    }
+                    
+                    return _store_tool_result("get_events_activities", events_cache_key, {
+                        "status": "success",
+                        "events": processed_events,
+                        "city": city,
+                        "theme": theme,
+                        "date": date,
+                        "source": "ticketmaster_api",
+                        "total_found": len(ticketmaster_events)
+                    }, state_delta, tool_context)
+                
+                return {
+                    "status": "error",
+                    "error_message": f"No events found in {city} for the selected date and theme",
+                    "city": city,
+                    "theme": theme
+                }
             except Exception as e:
-                print(f"[EVENTS] Ticketmaster API execution error: {e}")
+                logger.error("[EVENTS] Ticketmaster API execution error: %s", e)
                 return {
                     "status": "error",
                     "error_message": f"Events service unavailable: {str(e)}",
@@ -447,7 +695,7 @@ def get_events_activities(city: str, date: str, theme: str, tool_context: ToolCo
                 }
         
         # If no valid API key is configured
-        if not API_KEY or API_KEY == 'demo_key':
+        if _TICKETMASTER_API_KEY == 'demo_key':
             return {
                 "status": "error",
                 "error_message": "Events API key not configured",
@@ -456,7 +704,7 @@ def get_events_activities(city: str, date: str, theme: str, tool_context: ToolCo
             }
         
     except Exception as e:
-        print(f"[EVENTS] Events tool error: {e}")
+        logger.error("[EVENTS] Events tool error: %s", e)
         return {
             "status": "error", 
             "error_message": f"Unable to fetch events data: {str(e)}",
@@ -474,12 +722,11 @@ def process_booking(booking_details: dict, tool_context: ToolContext) -> dict:
     Returns:
         dict: Booking confirmation with payment status
     """
-    print(f"[BOOKING] Tool called")
-    print(f"[BOOKING] Processing booking with {len(booking_details)} details")
+    logger.info("[BOOKING] Tool called")
+    logger.info("[BOOKING] Processing booking with %s details", len(booking_details))
     
     # Validate required booking details
-    required_fields = ['user_info', 'payment_info']
-    missing_fields = [field for field in required_fields if field not in booking_details]
+    missing_fields = [field for field in REQUIRED_BOOKING_FIELDS if field not in booking_details]
     
     if missing_fields:
         return {
@@ -488,10 +735,11 @@ def process_booking(booking_details: dict, tool_context: ToolContext) -> dict:
         }
     
     # Generate booking confirmation
-    booking_id = f"TRV{random.randint(100000, 999999)}"
-    print(f"[BOOKING] Generated booking ID: {booking_id}")
+    booking_id = f"TRV{secrets.token_hex(3).upper()}"
+    logger.info("[BOOKING] Generated booking ID: %s", booking_id)
     
-    # Save booking to state
+    # Save booking to state. This only records an in-memory delta: ADK attaches it to the tool's
+    # event and the session service persists it after the response, so it must stay synchronous
     tool_context.state["last_booking"] = {
         "booking_id": booking_id,
         "details": booking_details,
@@ -507,8 +755,21 @@ def process_booking(booking_details: dict, tool_context: ToolContext) -> dict:
     }
 
 
+# Cloud Translation v3 client (gRPC channel), built once and shared across calls
+_TRANSLATE_CLIENT = None
+_TRANSLATE_CLIENT_LOCK = threading.Lock()
+
+def _get_translate_client():
+    """Return the shared Cloud Translation v3 client, creating it on first use"""
+    global _TRANSLATE_CLIENT
+    if _TRANSLATE_CLIENT is None:
+        with _TRANSLATE_CLIENT_LOCK:
+            if _TRANSLATE_CLIENT is None:
+                from google.cloud import translate_v3
+                _TRANSLATE_CLIENT = translate_v3.TranslationServiceClient()
+    return _TRANSLATE_CLIENT
 
-def translate_text(text: str, target_language: str, tool_context: ToolContext) -> dict:
+async def translate_text(text: str, target_language: str, tool_context: ToolContext) -> dict:
     """Translates text between English and Hindi using Google Translate API.
     
     Args:
@@ -519,36 +780,55 @@ def translate_text(text: str, target_language: str, tool_context: ToolContext) -
     Returns:
         dict: Translated text
     """
-    print(f"[TRANSLATE] Tool called for {target_language}")
-    print(f"[TRANSLATE] Text length: {len(text)} characters")
+    logger.info("[TRANSLATE] Tool called for %s", target_language)
+    logger.info("[TRANSLATE] Text length: %s characters", len(text))
+    
+    # Determine target language code
+    target_code = 'hi' if target_language.lower() == 'hindi' else 'en'
     
+    # Translations are deterministic per (text, target); key on a digest since cache_key lowercases strings
+    text_digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    translate_cache_key = cache_key("translate_text", text=text_digest, target=target_code)
+    cached = _cached_tool_result(translate_cache_key, tool_context)
+    if cached is not None:
+        logger.info("[TRANSLATE] Cache hit for %s", target_code)
+        return cached
+    
+    return await _coalesced(translate_cache_key, tool_context,
+                            lambda: _translate_text_live(text, target_language, target_code, translate_cache_key, tool_context))
+
+async def _translate_text_live(text: str, target_language: str, target_code: str, translate_cache_key,
+                               tool_context: ToolContext) -> dict:
+    """Call Google Cloud Translation for translate_text"""
     try:
-        # Use Google Cloud Translation API
-        from google.cloud import translate_v2 as translate
-        
-        translate_client = translate.Client()
-        
-        # Determine target language code
-        target_code = 'hi' if target_language.lower() == 'hindi' else 'en'
+        # Use Google Cloud Translation API (v3 over gRPC)
+        translate_client = _get_translate_client()
+        parent = f"projects/{os.environ['GOOGLE_CLOUD_PROJECT']}/locations/global"
         
         # Perform translation
-        result = translate_client.translate(text, target_language=target_code)
+        response = await _run_blocking(lambda: translate_client.translate_text(request={
+            "parent": parent,
+            "contents": [text],
+            "mime_type": "text/plain",
+            "target_language_code": target_code
+        }))
         
-        translated_text = result['translatedText']
-        detected_language = result.get('detectedSourceLanguage', 'unknown')
+        translation = response.translations[0]
+        translated_text = translation.translated_text
+        detected_language = translation.detected_language_code or 'unknown'
         
-        print(f"[TRANSLATE] Translation successful, detected source: {detected_language}")
+        logger.info("[TRANSLATE] Translation successful, detected source: %s", detected_language)
         
-        return {
+        return _store_tool_result("translate_text", translate_cache_key, {
             "status": "success",
             "original_text": text,
             "translated_text": translated_text,
             "target_language": target_language,
             "detected_source_language": detected_language
-        }
+        }, {}, tool_context)
         
     except Exception as e:
-        print(f"[TRANSLATE] Translation error: {e}")
+        logger.error("[TRANSLATE] Translation error: %s", e)
         return {
             "status": "error",
             "error_message": f"Translation service unavailable: {str(e)}",
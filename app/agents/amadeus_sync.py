@@ -5,15 +5,121 @@ This version uses requests library instead of aiohttp to avoid event loop confli
 """
 
 import os
+import json
+import functools
+import inspect
+import logging
+import re
+import hashlib
+import tempfile
+import threading
+from itertools import islice
+from types import MappingProxyType
+import orjson
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Dict, Any, Iterable, List, Mapping
 import random
 from dotenv import load_dotenv
+from .tool_cache import cache_key, cache_get, cache_set
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# City name -> airport IATA code for flight searches (simplified mapping, casefolded keys)
+FLIGHT_IATA_CODES: Mapping[str, str] = MappingProxyType({
+    'delhi': 'DEL',
+    'mumbai': 'BOM',
+    'bangalore': 'BLR',
+    'chennai': 'MAA',
+    'kolkata': 'CCU',
+    'hyderabad': 'HYD',
+    'pune': 'PNQ',
+    'ahmedabad': 'AMD',
+    'goa': 'GOI',
+    'kochi': 'COK',
+    'london': 'LHR',
+    'paris': 'CDG',
+    'new york': 'JFK',
+    'tokyo': 'NRT',
+    'singapore': 'SIN',
+    'dubai': 'DXB',
+    'bangkok': 'BKK',
+    'sydney': 'SYD'
+})
+
+# City name -> metropolitan city code for hotel searches (simplified mapping, casefolded keys)
+HOTEL_CITY_CODES: Mapping[str, str] = MappingProxyType({
+    'delhi': 'DEL',
+    'mumbai': 'BOM',
+    'bangalore': 'BLR',
+    'chennai': 'MAA',
+    'kolkata': 'CCU',
+    'hyderabad': 'HYD',
+    'pune': 'PNQ',
+    'goa': 'GOI',
+    'london': 'LON',
+    'paris': 'PAR',
+    'new york': 'NYC',
+    'tokyo': 'TYO',
+    'singapore': 'SIN',
+    'dubai': 'DXB',
+    'bangkok': 'BKK',
+    'sydney': 'SYD'
+})
+
+# ISO 8601 flight durations such as PT2H35M
+ISO_DURATION_PATTERN = re.compile(r'^PT(?:(\d+)H)?(?:(\d+)M)?$')
+
+# Refresh the access token in the background once it is this close to expiring
+TOKEN_REFRESH_WINDOW = timedelta(minutes=10)
+
+# How long successful searches are reused; hotel reference data changes rarely
+FLIGHT_SEARCH_TTL = 5 * 60
+HOTEL_SEARCH_TTL = 30 * 60
+
+
+def _city_to_code(name: str, table: Mapping[str, str], default: str) -> str:
+    """Look up a city code, tolerating surrounding whitespace and case/Unicode variants"""
+    return table.get(name.strip().casefold(), default)
+
+
+def _cache_successful_search(ttl: float):
+    """Cache a search method's successful results for ttl seconds, keyed on its arguments"""
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            del arguments['self']
+            key = cache_key(f"amadeus.{method.__name__}", **arguments)
+            
+            cached = cache_get(key)
+            if cached is not None:
+                logger.info("[AMADEUS] Cache hit for %s %s", method.__name__, arguments)
+                return dict(cached)
+            
+            result = method(self, *args, **kwargs)
+            if result.get('status') == 'success':
+                cache_set(key, result, ttl)
+            return dict(result)
+        return wrapper
+    return decorator
+
+
+def _loads(response: requests.Response) -> Any:
+    """Decode a JSON response body straight from bytes"""
+    return orjson.loads(response.content)
+
+
 class AmadeusSyncAPI:
     """Synchronous Amadeus API client for flight and hotel searches"""
     
@@ -23,18 +129,98 @@ class AmadeusSyncAPI:
         self.base_url = "https://test.api.amadeus.com"
         self.access_token = None
         self.token_expires = None
+        self._token_lock = threading.Lock()
+        self._refresh_in_flight = False
+        
+        # Token cache shared by all worker processes using the same credentials
+        self.token_cache_path = None
+        if self.api_key:
+            key_hash = hashlib.sha256(self.api_key.encode()).hexdigest()[:12]
+            self.token_cache_path = os.path.join(tempfile.gettempdir(), f"amadeus_tok_{key_hash}.json")
         
+        # Pooled keep-alive session shared by token, flight and hotel requests
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ))
+        self.session.headers['Content-Type'] = 'application/json'
+        # JSON compresses well; urllib3 decodes Brotli when the brotli package is installed
+        self.session.headers['Accept-Encoding'] = 'br, gzip'
+        
+    def _has_valid_token(self) -> bool:
+        return bool(self.access_token and self.token_expires and datetime.now() < self.token_expires)
+    
     def get_access_token(self) -> str:
         """Get OAuth2 access token for Amadeus API"""
-        if self.access_token and self.token_expires and datetime.now() < self.token_expires:
-            print("[AMADEUS] Using cached access token")
+        if self._has_valid_token():
+            # Close to expiry: refresh in the background and keep serving the current token
+            if self.token_expires - datetime.now() <= TOKEN_REFRESH_WINDOW and not self._refresh_in_flight:
+                self._refresh_in_flight = True
+                threading.Thread(target=self._background_refresh, name="amadeus-token-refresh", daemon=True).start()
+            logger.debug("[AMADEUS] Using cached access token")
             return self.access_token
-            
+        
+        # Serialize refreshes so parallel searches don't each request a new token
+        with self._token_lock:
+            if self._has_valid_token() or self._load_cached_token():
+                return self.access_token
+            return self._request_access_token()
+    
+    def _background_refresh(self) -> None:
+        """Refresh the token ahead of expiry so no search has to wait for the OAuth round trip"""
+        try:
+            with self._token_lock:
+                # Another caller may already have refreshed it
+                if self._has_valid_token() and self.token_expires - datetime.now() > TOKEN_REFRESH_WINDOW:
+                    return
+                if not self._load_cached_token() or self.token_expires - datetime.now() <= TOKEN_REFRESH_WINDOW:
+                    self._request_access_token()
+        except Exception as e:
+            logger.error("[AMADEUS] Background token refresh failed: %s", e)
+        finally:
+            self._refresh_in_flight = False
+    
+    def _load_cached_token(self) -> bool:
+        """Adopt a still-valid token another process saved to the token cache file"""
+        if not self.token_cache_path:
+            return False
+        try:
+            with open(self.token_cache_path, 'r') as f:
+                cached = json.load(f)
+            expires_at = datetime.fromisoformat(cached['expires_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        
+        if datetime.now() >= expires_at:
+            return False
+        
+        self.access_token = cached['access_token']
+        self.token_expires = expires_at
+        self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+        logger.debug("[AMADEUS] Using access token from shared token cache")
+        return True
+    
+    def _save_cached_token(self) -> None:
+        """Atomically write the current token to the token cache file"""
+        if not self.token_cache_path:
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.token_cache_path), suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'access_token': self.access_token, 'expires_at': self.token_expires.isoformat()}, f)
+            os.replace(tmp_path, self.token_cache_path)
+        except OSError as e:
+            logger.warning("[AMADEUS] Could not write token cache: %s", e)
+    
+    def _request_access_token(self) -> str:
+        """Request a new OAuth2 access token from Amadeus"""
         if not self.api_key or not self.api_secret:
-            print("[AMADEUS] API credentials missing")
+            logger.warning("[AMADEUS] API credentials missing")
             raise Exception("Amadeus API credentials not found in environment variables")
             
-        print("[AMADEUS] Requesting new access token...")
+        logger.info("[AMADEUS] Requesting new access token...")
         auth_url = f"{self.base_url}/v1/security/oauth2/token"
         
         data = {
@@ -48,78 +234,60 @@ class AmadeusSyncAPI:
         }
         
         try:
-            response = requests.post(auth_url, data=data, headers=headers, timeout=15)
+            response = self.session.post(auth_url, data=data, headers=headers, timeout=15)
             
             if response.status_code == 200:
-                token_data = response.json()
+                token_data = _loads(response)
                 self.access_token = token_data['access_token']
                 # Token expires in seconds, set expiry time with 5 min buffer
                 expires_in = token_data.get('expires_in', 1799)  # Default ~30 min
                 self.token_expires = datetime.now() + timedelta(seconds=expires_in - 300)
-                print("[AMADEUS] Access token obtained successfully")
+                self.session.headers['Authorization'] = f'Bearer {self.access_token}'
+                self._save_cached_token()
+                logger.info("[AMADEUS] Access token obtained successfully")
                 return self.access_token
             else:
-                print(f"[AMADEUS] Token request failed: {response.status_code} - {response.text}")
+                logger.error("[AMADEUS] Token request failed: %s - %s", response.status_code, response.text)
                 raise Exception(f"Failed to get Amadeus access token: {response.status_code} - {response.text}")
         except requests.exceptions.Timeout:
-            print("[AMADEUS] Token request timeout")
+            logger.warning("[AMADEUS] Token request timeout")
             raise Exception("Amadeus authentication service timeout")
         except requests.exceptions.ConnectionError:
-            print("[AMADEUS] Token request connection error")
+            logger.error("[AMADEUS] Token request connection error")
             raise Exception("Unable to connect to Amadeus authentication service")
     
+    @_cache_successful_search(FLIGHT_SEARCH_TTL)
     def search_flights(self, origin: str, destination: str, departure_date: str, 
                        adults: int = 1, max_results: int = 10) -> Dict[str, Any]:
         """Search for flight offers using Amadeus Flight Offers Search API"""
         try:
-            print(f"[AMADEUS] Starting flight search for {origin} -> {destination} on {departure_date}")
+            logger.info("[AMADEUS] Starting flight search for %s -> %s on %s", origin, destination, departure_date)
             
             # Check if departure date is valid (not in the past)
-            from datetime import datetime, date, timedelta
             try:
-                dep_date = datetime.strptime(departure_date, '%Y-%m-%d').date()
+                year, month, day = departure_date.split('-')
+                dep_date = date(int(year), int(month), int(day))
                 today = date.today()
                 if dep_date < today:
-                    print(f"[AMADEUS] ERROR: Departure date {departure_date} is in the past (today: {today})")
+                    logger.error("[AMADEUS] ERROR: Departure date %s is in the past (today: %s)", departure_date, today)
                     return {"status": "error", "error_message": f"Cannot search flights for past date {departure_date}. Please select a future date.", "flights": []}
                 elif dep_date == today:
-                    print(f"[AMADEUS] WARNING: Searching for same-day flights on {departure_date} - may have limited results")
+                    logger.warning("[AMADEUS] WARNING: Searching for same-day flights on %s - may have limited results", departure_date)
                     return {"status": "error", "error_message": f"Same-day flight bookings are very limited. Please select a date at least 1-2 days in advance for better results.", "flights": []}
                 elif dep_date <= today + timedelta(days=1):
-                    print(f"[AMADEUS] WARNING: Searching for next-day flights on {departure_date} - may have limited availability")
-            except ValueError as e:
-                print(f"[AMADEUS] ERROR: Invalid date format {departure_date}: {e}")
+                    logger.warning("[AMADEUS] WARNING: Searching for next-day flights on %s - may have limited availability", departure_date)
+            except (ValueError, AttributeError) as e:
+                logger.error("[AMADEUS] ERROR: Invalid date format %s: %s", departure_date, e)
                 return {"status": "error", "error_message": f"Invalid date format: {departure_date}", "flights": []}
             
             access_token = self.get_access_token()
-            print(f"[AMADEUS] Access token obtained: {access_token[:20]}...")
+            logger.debug("[AMADEUS] Access token obtained: %s...", access_token[:20])
             
-            # Convert city names to IATA codes (simplified mapping)
-            iata_mapping = {
-                'delhi': 'DEL',
-                'mumbai': 'BOM', 
-                'bangalore': 'BLR',
-                'chennai': 'MAA',
-                'kolkata': 'CCU',
-                'hyderabad': 'HYD',
-                'pune': 'PNQ',
-                'ahmedabad': 'AMD',
-                'goa': 'GOI',
-                'kochi': 'COK',
-                'london': 'LHR',
-                'paris': 'CDG',
-                'new york': 'JFK',
-                'tokyo': 'NRT',
-                'singapore': 'SIN',
-                'dubai': 'DXB',
-                'bangkok': 'BKK',
-                'sydney': 'SYD'
-            }
+            # Convert city names to IATA codes
+            origin_code = _city_to_code(origin, FLIGHT_IATA_CODES, 'DEL')  # Default to Delhi
+            dest_code = _city_to_code(destination, FLIGHT_IATA_CODES, 'BOM')  # Default to Mumbai
             
-            origin_code = iata_mapping.get(origin.lower(), 'DEL')  # Default to Delhi
-            dest_code = iata_mapping.get(destination.lower(), 'BOM')  # Default to Mumbai
-            
-            print(f"[AMADEUS] Searching flights: {origin} ({origin_code}) -> {destination} ({dest_code}) on {departure_date}")
+            logger.info("[AMADEUS] Searching flights: %s (%s) -> %s (%s) on %s", origin, origin_code, destination, dest_code, departure_date)
             
             search_url = f"{self.base_url}/v2/shopping/flight-offers"
             
@@ -133,78 +301,57 @@ class AmadeusSyncAPI:
                 'nonStop': 'false'
             }
             
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            print(f"[AMADEUS] API URL: {search_url}")
-            print(f"[AMADEUS] Parameters: {params}")
-            print(f"[AMADEUS] Making API request...")
+            logger.debug("[AMADEUS] API URL: %s", search_url)
+            logger.debug("[AMADEUS] Parameters: %s", params)
+            logger.debug("[AMADEUS] Making API request...")
             
-            response = requests.get(search_url, params=params, headers=headers, timeout=45)
-            print(f"[AMADEUS] Response status: {response.status_code}")
+            response = self.session.get(search_url, params=params, timeout=45)
+            logger.debug("[AMADEUS] Response status: %s (encoding: %s)", response.status_code,
+                         response.headers.get('Content-Encoding', 'identity'))
             
             if response.status_code == 200:
-                print(f"[AMADEUS] Success response received")
-                data = response.json()
-                print(f"[AMADEUS] Raw response keys: {list(data.keys()) if data and isinstance(data, dict) else 'Not a dict'}")
+                logger.debug("[AMADEUS] Success response received")
+                data = _loads(response)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[AMADEUS] Raw response keys: %s", list(data.keys()) if data and isinstance(data, dict) else 'Not a dict')
                 
                 if 'data' in data:
-                    print(f"[AMADEUS] Number of flight offers in response: {len(data['data'])}")
+                    logger.debug("[AMADEUS] Number of flight offers in response: %s", len(data['data']))
                 else:
-                    print(f"[AMADEUS] No 'data' key in response. Full response: {data}")
+                    logger.debug("[AMADEUS] No 'data' key in response. Full response: %s", data)
                 
                 result = self._process_flight_data(data, origin, destination)
                 
                 # Check if we actually got flight data
                 if not result.get('flights') or len(result.get('flights', [])) == 0:
-                    print(f"[AMADEUS] No flights found after processing API response")
-                    print(f"[AMADEUS] Processed result: {result}")
+                    logger.info("[AMADEUS] No flights found after processing API response")
+                    logger.debug("[AMADEUS] Processed result: %s", result)
                     return {"status": "error", "error_message": "No flights available for the selected route and date", "flights": []}
                 
-                print(f"[AMADEUS] Successfully processed {len(result.get('flights', []))} flights")
+                logger.info("[AMADEUS] Successfully processed %s flights", len(result.get('flights', [])))
                 return result
             else:
-                print(f"[AMADEUS] Flight API error: {response.status_code}")
-                print(f"[AMADEUS] Error response: {response.text}")
+                logger.error("[AMADEUS] Flight API error: %s", response.status_code)
+                logger.error("[AMADEUS] Error response: %s", response.text)
                 return {"status": "error", "error_message": f"Flight API error: {response.status_code} - {response.text[:200]}", "flights": []}
         except requests.exceptions.Timeout:
-            print(f"[AMADEUS] Flight search timeout - API took too long to respond")
+            logger.warning("[AMADEUS] Flight search timeout - API took too long to respond")
             return {"status": "error", "error_message": "Flight search service is currently slow. Please try again.", "flights": []}
         except requests.exceptions.ConnectionError:
-            print(f"[AMADEUS] Flight search connection error - Unable to reach API")
+            logger.error("[AMADEUS] Flight search connection error - Unable to reach API")
             return {"status": "error", "error_message": "Unable to connect to flight search service. Please check your connection.", "flights": []}
         except Exception as e:
-            print(f"[AMADEUS] Error in flight search: {e}")
+            logger.error("[AMADEUS] Error in flight search: %s", e)
             return {"status": "error", "error_message": f"Flight search failed: {str(e)}", "flights": []}
     
+    @_cache_successful_search(HOTEL_SEARCH_TTL)
     def search_hotels(self, city: str, adults: int = 1) -> Dict[str, Any]:
         """Search for hotels using Amadeus Hotel Search API"""
         try:
-            access_token = self.get_access_token()
-            
-            # Convert city names to codes (simplified mapping)
-            city_mapping = {
-                'delhi': 'DEL',
-                'mumbai': 'BOM',
-                'bangalore': 'BLR',
-                'chennai': 'MAA',
-                'kolkata': 'CCU',
-                'hyderabad': 'HYD',
-                'pune': 'PNQ',
-                'goa': 'GOI',
-                'london': 'LON',
-                'paris': 'PAR',
-                'new york': 'NYC',
-                'tokyo': 'TYO',
-                'singapore': 'SIN',
-                'dubai': 'DXB',
-                'bangkok': 'BKK',
-                'sydney': 'SYD'
-            }
+            self.get_access_token()  # Refreshes the session Authorization header if needed
             
-            city_code = city_mapping.get(city.lower(), 'DEL')  # Default to Delhi
+            # Convert city names to city codes
+            city_code = _city_to_code(city, HOTEL_CITY_CODES, 'DEL')  # Default to Delhi
             
             search_url = f"{self.base_url}/v1/reference-data/locations/hotels/by-city"
             
@@ -214,37 +361,33 @@ class AmadeusSyncAPI:
                 'radiusUnit': 'KM'
             }
             
-            headers = {
-                'Authorization': f'Bearer {access_token}',
-                'Content-Type': 'application/json'
-            }
-            
-            print(f"[AMADEUS] Searching hotels in {city} ({city_code})")
-            print(f"[AMADEUS] API URL: {search_url}")
-            print(f"[AMADEUS] Parameters: {params}")
+            logger.info("[AMADEUS] Searching hotels in %s (%s)", city, city_code)
+            logger.debug("[AMADEUS] API URL: %s", search_url)
+            logger.debug("[AMADEUS] Parameters: %s", params)
             
-            response = requests.get(search_url, params=params, headers=headers, timeout=45)
+            # Read the body in full so the keep-alive connection goes back to the pool;
+            # only the first 10 listings are processed
+            response = self.session.get(search_url, params=params, timeout=45)
             
             if response.status_code == 200:
-                data = response.json()
-                result = self._process_hotel_data(data, city)
+                result = self._process_hotel_data(_loads(response).get('data', []), city)
                 # Check if we actually got hotel data
                 if not result.get('hotels') or len(result.get('hotels', [])) == 0:
-                    print(f"[AMADEUS] No hotels found in API response")
+                    logger.info("[AMADEUS] No hotels found in API response")
                     return {"status": "error", "error_message": f"No hotels available in {city}", "hotels": []}
                 return result
             else:
-                print(f"[AMADEUS] Hotel API error: {response.status_code} - {response.text}")
+                logger.error("[AMADEUS] Hotel API error: %s - %s", response.status_code, response.text)
                 return {"status": "error", "error_message": f"Hotel API error: {response.status_code}", "hotels": []}
                 
         except requests.exceptions.Timeout:
-            print(f"[AMADEUS] Hotel search timeout - API took too long to respond")
+            logger.warning("[AMADEUS] Hotel search timeout - API took too long to respond")
             return {"status": "error", "error_message": "Hotel search service is currently slow. Please try again.", "hotels": []}
         except requests.exceptions.ConnectionError:
-            print(f"[AMADEUS] Hotel search connection error - Unable to reach API")
+            logger.error("[AMADEUS] Hotel search connection error - Unable to reach API")
             return {"status": "error", "error_message": "Unable to connect to hotel search service. Please check your connection.", "hotels": []}
         except Exception as e:
-            print(f"[AMADEUS] Error in hotel search: {e}")
+            logger.error("[AMADEUS] Error in hotel search: %s", e)
             return {"status": "error", "error_message": f"Hotel search failed: {str(e)}", "hotels": []}
     
     def _process_flight_data(self, data: Dict[str, Any], origin: str, destination: str) -> Dict[str, Any]:
@@ -252,27 +395,17 @@ class AmadeusSyncAPI:
         processed_flights = []
         
         if 'data' in data:
-            for offer in data['data'][:10]:  # Limit to top 10 offers
+            for offer in islice(data['data'], 10):  # Limit to top 10 offers
                 try:
-                    itinerary = offer['itineraries'][0]  # Take first itinerary
-                    segment = itinerary['segments'][0]   # Take first segment
-                    
-                    # Extract airline info
-                    airline_code = segment['carrierCode']
-                    flight_number = f"{airline_code}{segment['number']}"
-                    
-                    # Extract timing
-                    departure_time = segment['departure']['at']
-                    arrival_time = segment['arrival']['at']
-                    duration = itinerary['duration']
-                    
-                    # Extract price
-                    price_info = offer['price']
-                    total_price = float(price_info['total'])
-                    currency = price_info['currency']
+                    (airline_code, segment_number, departure_time, arrival_time, duration,
+                     total_price, currency, departure_airport, arrival_airport) = self._extract_offer_fields(offer)
+                    flight_number = f"{airline_code}{segment_number}"
+                    # ISO timestamps look like 2024-05-01T06:45:00; keep HH:MM
+                    departure_hm = departure_time[11:16] if departure_time[10:11] == 'T' else 'TBD'
+                    arrival_hm = arrival_time[11:16] if arrival_time[10:11] == 'T' else 'TBD'
                     
                     # DEBUG: Print actual price data
-                    print(f"[AMADEUS DEBUG] Flight {flight_number}: Raw price = {total_price} {currency}")
+                    logger.debug("[AMADEUS DEBUG] Flight %s: Raw price = %s %s", flight_number, total_price, currency)
                     
                     # Format for our application - match frontend expectations
                     flight = {
@@ -284,25 +417,25 @@ class AmadeusSyncAPI:
                         'price': int(total_price),
                         'currency': currency,
                         'departure': {
-                            'time': departure_time.split('T')[1][:5] if 'T' in departure_time else 'TBD',
-                            'airport': segment['departure']['iataCode']
+                            'time': departure_hm,
+                            'airport': departure_airport
                         },
                         'arrival': {
-                            'time': arrival_time.split('T')[1][:5] if 'T' in arrival_time else 'TBD',  
-                            'airport': segment['arrival']['iataCode']
+                            'time': arrival_hm,
+                            'airport': arrival_airport
                         },
                         # Keep flat structure for backward compatibility
-                        'departure_time': departure_time.split('T')[1][:5] if 'T' in departure_time else 'TBD',
-                        'arrival_time': arrival_time.split('T')[1][:5] if 'T' in arrival_time else 'TBD',
-                        'departure_airport': segment['departure']['iataCode'],
-                        'arrival_airport': segment['arrival']['iataCode'],
+                        'departure_time': departure_hm,
+                        'arrival_time': arrival_hm,
+                        'departure_airport': departure_airport,
+                        'arrival_airport': arrival_airport,
                         'source': 'Amadeus API'
                     }
                     
                     processed_flights.append(flight)
                     
                 except Exception as e:
-                    print(f"[AMADEUS] Error processing flight offer: {e}")
+                    logger.error("[AMADEUS] Error processing flight offer: %s", e)
                     continue
         
         return {
@@ -312,12 +445,34 @@ class AmadeusSyncAPI:
             'source': 'Amadeus Flight API'
         }
     
-    def _process_hotel_data(self, data: Dict[str, Any], city: str) -> Dict[str, Any]:
-        """Process raw Amadeus hotel data into standardized format"""
+    @staticmethod
+    def _extract_offer_fields(offer: Dict[str, Any]) -> tuple:
+        """Pull only the fields we use from a flight offer (first itinerary, first segment)"""
+        itinerary = offer['itineraries'][0]
+        segment = itinerary['segments'][0]
+        departure = segment['departure']
+        arrival = segment['arrival']
+        price_info = offer['price']
+        return (
+            segment['carrierCode'],
+            segment['number'],
+            departure['at'],
+            arrival['at'],
+            itinerary['duration'],
+            float(price_info['total']),
+            price_info['currency'],
+            departure['iataCode'],
+            arrival['iataCode']
+        )
+    
+    def _process_hotel_data(self, hotels: Iterable[Dict[str, Any]], city: str) -> Dict[str, Any]:
+        """Process raw Amadeus hotel entries into standardized format"""
         processed_hotels = []
+        # Seed from the city so the demo prices/ratings are stable across calls and processes
+        rng = random.Random(f"amadeus-hotels:{city.strip().casefold()}")
         
-        if 'data' in data:
-            for hotel in data['data'][:10]:  # Limit to top 10 hotels
+        if hotels:
+            for hotel in islice(hotels, 10):  # Limit to top 10 hotels
                 try:
                     # Extract hotel details from reference data
                     hotel_name = hotel.get('name', 'Unknown Hotel')
@@ -330,13 +485,13 @@ class AmadeusSyncAPI:
                     
                     # Since this is reference data, we'll use estimated pricing
                     # In a real implementation, you'd make another call to get actual offers
-                    base_price = random.randint(3000, 15000)  # Random price in INR for demo
+                    base_price = rng.randint(3000, 15000)  # Random price in INR for demo
                     
                     # DEBUG: Print actual hotel price data
-                    print(f"[AMADEUS DEBUG] Hotel {hotel_name}: Generated price = {base_price} INR")
+                    logger.debug("[AMADEUS DEBUG] Hotel %s: Generated price = %s INR", hotel_name, base_price)
                     
                     # Assume rating (this endpoint may not have ratings)
-                    hotel_rating = hotel.get('rating', random.randint(3, 5))
+                    hotel_rating = hotel.get('rating', rng.randint(3, 5))
                     
                     # Format for our application
                     hotel_entry = {
@@ -353,7 +508,7 @@ class AmadeusSyncAPI:
                     processed_hotels.append(hotel_entry)
                     
                 except Exception as e:
-                    print(f"[AMADEUS] Error processing hotel offer: {e}")
+                    logger.error("[AMADEUS] Error processing hotel offer: %s", e)
                     continue
         
         return {
@@ -365,23 +520,13 @@ class AmadeusSyncAPI:
     
     def _format_duration(self, duration: str) -> str:
         """Format duration from ISO format to readable format"""
-        try:
-            # Remove PT prefix and parse
-            duration = duration.replace('PT', '')
-            hours = 0
-            minutes = 0
-            
-            if 'H' in duration:
-                parts = duration.split('H')
-                hours = int(parts[0])
-                if len(parts) > 1 and 'M' in parts[1]:
-                    minutes = int(parts[1].replace('M', ''))
-            elif 'M' in duration:
-                minutes = int(duration.replace('M', ''))
-                
-            return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
-        except:
+        match = ISO_DURATION_PATTERN.match(duration)
+        if not match:
             return duration
+        
+        hours = int(match.group(1) or 0)
+        minutes = int(match.group(2) or 0)
+        return f"{hours}h {minutes}m" if hours > 0 else f"{minutes}m"
     
 
 
@@ -389,10 +534,22 @@ class AmadeusSyncAPI:
 # Global instance
 amadeus_sync = AmadeusSyncAPI()
 
+# Bounded pool for fanning out independent searches (kept below the session's pool_maxsize)
+_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="amadeus")
+
 def get_flight_offers_sync(origin: str, destination: str, departure_date: str, adults: int = 1) -> Dict[str, Any]:
     """Synchronous function to get flight offers"""
     return amadeus_sync.search_flights(origin, destination, departure_date, adults)
 
 def get_hotel_offers_sync(city: str, adults: int = 1) -> Dict[str, Any]:
     """Synchronous function to get hotel offers"""
-    return amadeus_sync.search_hotels(city, adults)
\ No newline at end of file
+    return amadeus_sync.search_hotels(city, adults)
+
+def search_trip_sync(flight_args: Dict[str, Any], hotel_args_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run one flight search and any number of hotel searches concurrently"""
+    flight_future = _POOL.submit(amadeus_sync.search_flights, **flight_args)
+    hotel_futures = [_POOL.submit(amadeus_sync.search_hotels, **hotel_args) for hotel_args in hotel_args_list]
+    return {
+        'flights': flight_future.result(),
+        'hotels': [future.result() for future in hotel_futures]
+    }
\ No newline at end of file
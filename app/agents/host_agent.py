@@ -2,32 +2,25 @@
 Host Agent implementation using Google ADK framework
 """
 import asyncio
+import functools
+import inspect
+import itertools
+import logging
 import os
-from typing import Dict, List, Any, Optional
+import time
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import json
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Ensure Google Cloud environment variables are set
-project_id = os.getenv('VERTEX_PROJECT_ID', 'adroit-coral-472416-k2')
-location = os.getenv('VERTEX_LOCATION', 'us-central1')
-credentials_path = os.path.abspath(os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'credentials/adroit-coral-472416-k2-ff36978706d6.json'))
-
-os.environ['GOOGLE_CLOUD_PROJECT'] = project_id
-os.environ['GOOGLE_CLOUD_LOCATION'] = location  
-os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = 'True'
+import orjson
 
 from google.adk.agents import Agent
-from google.adk.sessions import InMemorySessionService
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
 from .adk_framework import (
+    DirectToolContext,
     get_weather,
     get_transport_options,
     get_accommodation_options,
@@ -35,14 +28,93 @@ from .adk_framework import (
     process_booking,
     translate_text
 )
+from .session_service import BoundedInMemorySessionService
+from ..config import configure_env
+
+logger = logging.getLogger(__name__)
+
+
+# Planning prompt, filled once per request with format_map
+_QUERY_TEMPLATE = """
+CREATE THE ITINERARY FROM THESE API TOOL RESULTS:
+
+USER REQUEST:
+FROM: {from_city}
+TO: {destination}
+DATES: {start_date} to {end_date}
+TRAVELERS: {travelers}
+BUDGET: ₹{budget_inr:,} INR
+THEME: {theme}
+DURATION: {duration} days
+
+TOOL RESULTS (JSON):
+{tool_results}
+
+Create a detailed {duration}-day itinerary using the actual API results.
+Include real flight details, hotel names, weather info, and events with actual prices.
+
+{flight_info}
+{hotel_info}
+"""
+
+
+def _as_async_tool(fn):
+    """Run a synchronous tool on a worker thread so it cannot block the event loop"""
+    if inspect.iscoroutinefunction(fn):
+        return fn
+    
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return wrapper
+
+
+# Fields of a selected flight/hotel worth spending prompt tokens on
+_SELECTED_FLIGHT_FIELDS = ('airline', 'flight_number', 'departure_time', 'arrival_time', 'duration', 'price')
+_SELECTED_HOTEL_FIELDS = ('name', 'rating', 'location', 'price_per_night', 'amenities')
+
+# Upper bound in seconds on one agent turn, so a stalled Gemini or tool call cannot hang a request
+_AGENT_TIMEOUTS = {
+    'host': 120,
+    'booking': 60,
+    'weather': 45
+}
+
+# Booking details the booking agent cannot proceed without (common to both booking forms)
+_REQUIRED_USER_FIELDS = ('email', 'phone')
+_REQUIRED_PAYMENT_FIELDS = ('expiry', 'cvv')
+
+
+def _compact(record: Dict[str, Any], fields: Optional[Tuple[str, ...]] = None) -> str:
+    """Render a record as key=value pairs joined by '|', skipping empty and N/A values"""
+    items = record.items() if fields is None else ((field, record.get(field)) for field in fields)
+    parts = []
+    for key, value in items:
+        if value is None or value == 'N/A' or (isinstance(value, (str, list, tuple, dict)) and not value):
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ','.join(map(str, value))
+        elif isinstance(value, dict):
+            value = orjson.dumps(value, default=str).decode()
+        parts.append(f"{key}={value}")
+    return '|'.join(parts)
+
 
 class HostAgent:
     """
     Host Agent that orchestrates all travel planning agents using Google ADK
     """
     
+    # Suffix that keeps session IDs unique when several start in the same nanosecond tick
+    _session_counter = itertools.count()
+    
     def __init__(self):
-        self.session_service = InMemorySessionService()
+        configure_env()
+        # Budgets arrive in USD; itineraries are priced in INR
+        self.usd_to_inr_rate = int(os.getenv('USD_INR_RATE', '83'))
+        # Cap concurrent Gemini turns so bursts queue here instead of tripping Vertex AI quotas
+        self._llm_semaphore = asyncio.Semaphore(int(os.getenv('GEMINI_MAX_CONCURRENCY', '16')))
+        self.session_service = BoundedInMemorySessionService()
         self.app_name = "travel_planner_adk"
         self.agents = {}
         self.runners = {}
@@ -56,16 +128,17 @@ class HostAgent:
             name="travel_planner_agent",
             model="gemini-2.5-flash",
             description="Complete travel planning agent that calls all API tools directly",
-            instruction="You are a travel planning agent. You MUST call the API tools directly to get real data. "
-                       "MANDATORY: Use these tools to gather data:\n"
+            instruction="You are a travel planning agent. The request already contains the results of these API tools:\n"
                        "1. get_weather(city, tool_context) - Get weather forecast\n"
                        "2. get_transport_options(origin, destination, travel_date, tool_context) - Get flights\n"
                        "3. get_accommodation_options(city, checkin_date, checkout_date, budget_range, tool_context) - Get hotels\n"
                        "4. get_events_activities(city, date, theme, tool_context) - Get activities\n"
-                       "CALL ALL TOOLS DIRECTLY. DO NOT ask for data or delegate.\n"
-                       "If any tool returns an error, state the error clearly and continue with other tools.\n"
+                       "USE THE PROVIDED TOOL RESULTS. Only call a tool yourself if its result is missing, "
+                       "and request any such tools together in a single turn so they run in parallel. DO NOT ask for data or delegate.\n"
+                       "If any tool result is an error, state the error clearly and continue with the other results.\n"
                        "Create a complete itinerary using only the actual tool results with real prices and details.",
-            tools=[get_weather, get_transport_options, get_accommodation_options, get_events_activities, translate_text],
+            tools=[_as_async_tool(tool) for tool in (get_weather, get_transport_options, get_accommodation_options,
+                                                      get_events_activities, translate_text)],
             output_key="main_response"
         )
         
@@ -78,137 +151,215 @@ class HostAgent:
                        "ONLY the actual user information and payment details provided. Do NOT simulate or "
                        "generate fake booking details. Validate that all required information is present "
                        "before processing. If any required information is missing, request it from the user.",
-            tools=[process_booking],
+            tools=[_as_async_tool(process_booking)],
             output_key="last_booking_confirmation"
         )
+        
+        # Weather Agent - single-tool agent for itinerary weather checks
+        self.agents['weather'] = Agent(
+            name="weather_agent",
+            model="gemini-2.5-flash",
+            description="Checks the weather forecast for an existing itinerary",
+            instruction="You are a weather specialist. Use only the get_weather tool to fetch the forecast for the "
+                       "itinerary's destination, then summarize conditions that affect the plan and suggest any "
+                       "necessary changes.",
+            tools=[_as_async_tool(get_weather)],
+            output_key="weather_update"
+        )
+        
+        # One long-lived runner per agent; sessions are chosen per call
+        for name, agent in self.agents.items():
+            self.runners[name] = Runner(
+                agent=agent,
+                app_name=self.app_name,
+                session_service=self.session_service
+            )
     
-    async def orchestrate_trip_planning(self, travel_request: Dict[str, Any]) -> Dict[str, Any]:
+    def _new_session_id(self, prefix: str) -> str:
+        """Build a unique session ID without formatting the current time"""
+        return f"{prefix}_{time.time_ns()}_{next(self._session_counter)}"
+    
+    async def _final_response(self, agent_name: str, user_id: str, session_id: str, query: str) -> Optional[str]:
         """
-        Main orchestration method using Google ADK Runner
+        Run one agent turn and return the text of its final response
+        Raises TimeoutError if the turn, including waiting for a Gemini slot, exceeds the agent's timeout
         """
+        content = types.Content(role='user', parts=[types.Part(text=query)])
+        timeout = _AGENT_TIMEOUTS[agent_name]
         try:
-            # Create session for this request
-            session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            user_id = "user_travel_planner"
-            
-            session = await self.session_service.create_session(
-                app_name=self.app_name,
+            async with asyncio.timeout(timeout), self._llm_semaphore:
+                events = self.runners[agent_name].run_async(
+                    user_id=user_id,
+                    session_id=session_id,
+                    new_message=content
+                )
+                try:
+                    async for event in events:
+                        if event.is_final_response():
+                            if event.content and event.content.parts:
+                                return event.content.parts[0].text
+                            return None
+                finally:
+                    # Close the generator now so ADK stops producing events once we have the answer
+                    await events.aclose()
+        except TimeoutError:
+            logger.warning("[HOST] %s agent timed out after %ss", agent_name, timeout)
+            raise TimeoutError(f"The {agent_name} agent did not respond within {timeout} seconds") from None
+        return None
+    
+    async def _stream_text(self, agent_name: str, user_id: str, session_id: str, query: str) -> AsyncIterator[str]:
+        """
+        Run one agent turn with SSE streaming and yield response text as Gemini produces it
+        The agent's timeout bounds the whole turn, including waiting for a Gemini slot; each later wait gets what is left of it.
+        Events are pulled in the caller's task (no wait_for) so ADK's tracing context stays the same across steps.
+        """
+        content = types.Content(role='user', parts=[types.Part(text=query)])
+        timeout = _AGENT_TIMEOUTS[agent_name]
+        deadline = asyncio.get_running_loop().time() + timeout
+        
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self._llm_semaphore.acquire()
+        except TimeoutError:
+            logger.warning("[HOST] %s agent timed out after %ss", agent_name, timeout)
+            raise TimeoutError(f"The {agent_name} agent did not respond within {timeout} seconds") from None
+        try:
+            events = self.runners[agent_name].run_async(
                 user_id=user_id,
                 session_id=session_id,
-                state=travel_request  # Initialize with travel request
+                new_message=content,
+                run_config=RunConfig(streaming_mode=StreamingMode.SSE)
             )
-            
-            # Create runner for host agent
-            runner = Runner(
-                agent=self.agents['host'],
-                app_name=self.app_name,
-                session_service=self.session_service
+            streamed = False
+            try:
+                while True:
+                    try:
+                        # The scope closes before any yield, so it never spans the consumer's code
+                        async with asyncio.timeout_at(deadline):
+                            event = await anext(events, None)
+                    except TimeoutError:
+                        logger.warning("[HOST] %s agent timed out after %ss", agent_name, timeout)
+                        raise TimeoutError(f"The {agent_name} agent did not respond within {timeout} seconds") from None
+                    if event is None:
+                        return
+                    
+                    parts = event.content.parts if event.content and event.content.parts else ()
+                    text = ''.join(part.text for part in parts if part.text)
+                    if event.partial:
+                        streamed = True
+                        if text:
+                            yield text
+                    elif event.is_final_response():
+                        # The closing event repeats the whole text when partial chunks were already sent
+                        if text and not streamed:
+                            yield text
+                        return
+                    else:
+                        streamed = False
+            finally:
+                await events.aclose()
+        finally:
+            self._llm_semaphore.release()
+    
+    async def _gather_context(self, travel_request: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Call the four independent data tools concurrently before the planning turn
+        Returns the results keyed by tool name and the session state the tools wrote
+        Re-plans for the same destination and dates are served from the tools' TTL cache,
+        and identical concurrent calls share one upstream request
+        """
+        destination = travel_request.get('destination')
+        from_city = travel_request.get('fromCity')
+        start_date = travel_request.get('startDate')
+        end_date = travel_request.get('endDate')
+        tool_context = DirectToolContext(dict(travel_request))
+        
+        calls = {
+            "get_weather": get_weather(destination, tool_context),
+            "get_accommodation_options": get_accommodation_options(
+                destination, start_date, end_date, travel_request.get('hotelBudget', 'mid-range'), tool_context),
+            "get_events_activities": get_events_activities(destination, start_date, travel_request.get('theme'), tool_context)
+        }
+        if from_city:
+            calls["get_transport_options"] = get_transport_options(from_city, destination, start_date, tool_context)
+        
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        
+        tool_results = {}
+        for tool_name, result in zip(calls, results):
+            if isinstance(result, BaseException):
+                logger.error("[HOST] %s failed: %s", tool_name, result)
+                result = {"status": "error", "error_message": str(result)}
+            tool_results[tool_name] = result
+        return tool_results, tool_context.state
+    
+    async def _prepare_planning(self, travel_request: Dict[str, Any]) -> Tuple[str, str, str]:
+        """Prefetch tool data, create the planning session and build the prompt; returns (user_id, session_id, query)"""
+        # Fetch weather, flights, hotels and events in parallel rather than one LLM tool call at a time
+        tool_results, initial_state = await self._gather_context(travel_request)
+        
+        # Create session for this request
+        session_id = self._new_session_id("session")
+        user_id = "user_travel_planner"
+        
+        await self.session_service.create_session(
+            app_name=self.app_name,
+            user_id=user_id,
+            session_id=session_id,
+            state=initial_state  # Travel request plus the tools' state updates
+        )
+        
+        # Create user query
+        start_date = travel_request.get('startDate')
+        end_date = travel_request.get('endDate')
+        from_city = travel_request.get('fromCity')
+        
+        # Convert budget to INR if needed (assuming USD input)
+        budget_usd = travel_request.get('budget', 1000)
+        budget_inr = int(budget_usd * self.usd_to_inr_rate)
+        
+        # Check if user has selected flight and hotel details
+        selected_flight = travel_request.get('selectedFlight', None)
+        selected_hotel = travel_request.get('selectedHotel', None)
+        
+        flight_info = ""
+        hotel_info = ""
+        
+        if selected_flight:
+            flight_info = (
+                f"SELECTED FLIGHT (price in INR): {_compact(selected_flight, _SELECTED_FLIGHT_FIELDS)}\n"
+                "Please incorporate this specific flight into the itinerary and plan activities accordingly."
+            )
+        
+        if selected_hotel:
+            hotel_info = (
+                f"SELECTED ACCOMMODATION (price in INR): {_compact(selected_hotel, _SELECTED_HOTEL_FIELDS)}\n"
+                "Please use this specific hotel as the base for your itinerary recommendations."
             )
-            
-            # Create user query
-            start_date = travel_request.get('startDate', '')
-            end_date = travel_request.get('endDate', '')
-            from_city = travel_request.get('fromCity', '')
-            date_info = f"from {start_date} to {end_date}" if start_date and end_date else ""
-            origin_info = f"traveling from {from_city}" if from_city else ""
-            
-            # Get number of travelers and group type
-            travelers = travel_request.get('travelers', 1)
-            group_type = "solo traveler" if travelers == 1 else f"group of {travelers} travelers"
-            
-            # Get hotel budget preference
-            hotel_budget = travel_request.get('hotelBudget', 'mid-range')
-            budget_ranges = {
-                'budget': '≤₹3,000 per night',
-                'mid-range': '₹3,001-₹7,999 per night', 
-                'luxury': '≥₹8,000 per night'
-            }
-            budget_description = budget_ranges.get(hotel_budget, 'mid-range pricing')
-            
-            group_context = ""
-            if travelers == 1:
-                group_context = "Focus on solo-friendly activities, hostels or budget hotels, and opportunities to meet other travelers."
-            elif travelers == 2:
-                group_context = "Perfect for couples or friends - include romantic spots, couple activities, and shared accommodations."
-            elif travelers <= 4:
-                group_context = "Small group travel - recommend group activities, family rooms or connecting rooms, and experiences suitable for small groups."
-            else:
-                group_context = "Large group travel - focus on group discounts, multiple rooms or large accommodations, group tours, and activities that work well for bigger parties."
-
-            # Convert budget to INR if needed (assuming USD input)
-            budget_usd = travel_request.get('budget', 1000)
-            budget_inr = int(budget_usd * 83)  # Convert USD to INR (1 USD = 83 INR)
-            
-            # Check if user has selected flight and hotel details
-            selected_flight = travel_request.get('selectedFlight', None)
-            selected_hotel = travel_request.get('selectedHotel', None)
-            
-            flight_info = ""
-            hotel_info = ""
-            
-            if selected_flight:
-                flight_info = f"""
-                SELECTED FLIGHT DETAILS:
-                - Airline: {selected_flight.get('airline', 'N/A')}
-                - Flight: {selected_flight.get('flight_number', 'N/A')}
-                - Departure: {selected_flight.get('departure_time', 'N/A')}
-                - Arrival: {selected_flight.get('arrival_time', 'N/A')}
-                - Duration: {selected_flight.get('duration', 'N/A')}
-                - Cost: ₹{selected_flight.get('price', 0)}
-                
-                Please incorporate this specific flight into the itinerary and plan activities accordingly.
-                """
-            
-            if selected_hotel:
-                hotel_info = f"""
-                SELECTED ACCOMMODATION:
-                - Hotel: {selected_hotel.get('name', 'N/A')}
-                - Rating: {selected_hotel.get('rating', 'N/A')}
-                - Location: {selected_hotel.get('location', 'N/A')}
-                - Cost per night: ₹{selected_hotel.get('price_per_night', 0)}
-                - Amenities: {', '.join(selected_hotel.get('amenities', []))}
-                
-                Please use this specific hotel as the base for your itinerary recommendations.
-                """
-
-            query = f"""
-            EXECUTE THESE API TOOLS NOW TO CREATE THE ITINERARY:
-
-            USER REQUEST:
-            FROM: {travel_request.get('fromCity')}
-            TO: {travel_request.get('destination')}
-            DATES: {travel_request.get('startDate')} to {travel_request.get('endDate')}
-            TRAVELERS: {travel_request.get('travelers')}
-            BUDGET: ₹{budget_inr:,} INR
-            THEME: {travel_request.get('theme')}
-            DURATION: {travel_request.get('duration')} days
-
-            EXECUTE THESE TOOLS RIGHT NOW:
-            1. get_weather("{travel_request.get('destination')}")
-            2. get_transport_options("{travel_request.get('fromCity')}", "{travel_request.get('destination')}", "{travel_request.get('startDate')}")
-            3. get_accommodation_options("{travel_request.get('destination')}", "{travel_request.get('startDate')}", "{travel_request.get('endDate')}", "{hotel_budget}")
-            4. get_events_activities("{travel_request.get('destination')}", "{travel_request.get('startDate')}", "{travel_request.get('theme')}")
 
-            After calling ALL tools, create a detailed {travel_request.get('duration')}-day itinerary using the actual API results.
-            Include real flight details, hotel names, weather info, and events with actual prices.
-            
-            {flight_info}
-            {hotel_info}
-            """
-            
-            # Execute the agent team
-            content = types.Content(role='user', parts=[types.Part(text=query)])
+        query = _QUERY_TEMPLATE.format_map({
+            "from_city": from_city,
+            "destination": travel_request.get('destination'),
+            "start_date": start_date,
+            "end_date": end_date,
+            "travelers": travel_request.get('travelers'),
+            "budget_inr": budget_inr,
+            "theme": travel_request.get('theme'),
+            "duration": travel_request.get('duration'),
+            "tool_results": orjson.dumps(tool_results, default=str).decode(),
+            "flight_info": flight_info,
+            "hotel_info": hotel_info
+        })
+        return user_id, session_id, query
+    
+    async def orchestrate_trip_planning(self, travel_request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Main orchestration method using Google ADK Runner
+        """
+        try:
+            user_id, session_id, query = await self._prepare_planning(travel_request)
             
-            final_response = None
-            async for event in runner.run_async(
-                user_id=user_id, 
-                session_id=session_id, 
-                new_message=content
-            ):
-                if event.is_final_response():
-                    if event.content and event.content.parts:
-                        final_response = event.content.parts[0].text
-                    break
+            final_response = await self._final_response('host', user_id, session_id, query)
             
             # Get updated session to retrieve any state changes
             updated_session = await self.session_service.get_session(
@@ -232,42 +383,45 @@ class HostAgent:
                 "timestamp": datetime.now().isoformat()
             }
     
+    async def orchestrate_trip_planning_stream(self, travel_request: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Streaming variant of orchestrate_trip_planning: yields itinerary text as it is generated
+        so a UI can render before the whole response is ready
+        """
+        user_id, session_id, query = await self._prepare_planning(travel_request)
+        async for chunk in self._stream_text('host', user_id, session_id, query):
+            yield chunk
+    
     async def handle_booking(self, booking_request: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle booking requests using the booking agent
         """
         try:
-            session_id = booking_request.get('itinerary_id', f"booking_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
-            user_id = "user_travel_planner"
+            # Reject incomplete requests here; the agent would only spend a turn asking for them
+            user_info = booking_request.get('user_info') or {}
+            payment_info = booking_request.get('payment_info') or {}
+            missing_fields = [f"user_info.{field}" for field in _REQUIRED_USER_FIELDS if not user_info.get(field)]
+            missing_fields += [f"payment_info.{field}" for field in _REQUIRED_PAYMENT_FIELDS if not payment_info.get(field)]
+            if missing_fields:
+                return {
+                    "success": False,
+                    "error": f"Missing required booking information: {', '.join(missing_fields)}",
+                    "timestamp": datetime.now().isoformat()
+                }
             
-            # Create runner for booking agent
-            runner = Runner(
-                agent=self.agents['booking'],
-                app_name=self.app_name,
-                session_service=self.session_service
-            )
+            session_id = booking_request.get('itinerary_id') or self._new_session_id("booking")
+            user_id = "user_travel_planner"
             
             query = f"""
             Please process this booking request using ONLY the provided real user information:
-            - User Info: {booking_request.get('user_info', {})}
-            - Payment Info: {booking_request.get('payment_info', {})}
+            - User Info: {_compact(user_info)}
+            - Payment Info: {_compact(payment_info)}
             - Itinerary ID: {booking_request.get('itinerary_id', 'N/A')}
             
             Process the booking using only the actual information provided. Do not generate or simulate any data.
             """
             
-            content = types.Content(role='user', parts=[types.Part(text=query)])
-            
-            final_response = None
-            async for event in runner.run_async(
-                user_id=user_id,
-                session_id=session_id,
-                new_message=content
-            ):
-                if event.is_final_response():
-                    if event.content and event.content.parts:
-                        final_response = event.content.parts[0].text
-                    break
+            final_response = await self._final_response('booking', user_id, session_id, query)
             
             return {
                 "success": True,
@@ -288,26 +442,23 @@ class HostAgent:
         Check for weather updates that might affect the itinerary
         """
         try:
-            # Create runner for weather agent
-            runner = Runner(
-                agent=self.agents['weather'],
+            user_id = "user_travel_planner"
+            session = await self.session_service.get_session(
                 app_name=self.app_name,
-                session_service=self.session_service
+                user_id=user_id,
+                session_id=itinerary_id
             )
+            if session is None:
+                return {
+                    "success": False,
+                    "error": f"Itinerary {itinerary_id} not found",
+                    "timestamp": datetime.now().isoformat()
+                }
             
-            query = f"Check for weather updates for itinerary {itinerary_id} and suggest any necessary changes."
-            content = types.Content(role='user', parts=[types.Part(text=query)])
-            
-            final_response = None
-            async for event in runner.run_async(
-                user_id="user_travel_planner",
-                session_id=itinerary_id,
-                new_message=content
-            ):
-                if event.is_final_response():
-                    if event.content and event.content.parts:
-                        final_response = event.content.parts[0].text
-                    break
+            destination = session.state.get('destination', 'the destination')
+            query = (f"Check for weather updates in {destination} for itinerary {itinerary_id} "
+                     "and suggest any necessary changes.")
+            final_response = await self._final_response('weather', user_id, itinerary_id, query)
             
             return {
                 "success": True,
@@ -324,31 +475,13 @@ class HostAgent:
     
     async def translate_text(self, text: str, target_language: str) -> str:
         """
-        Translate text using the host agent's translation capability
+        Translate text by calling the translation tool directly (no LLM turn needed)
         """
         try:
-            # Create runner for host agent (which has translation tool)
-            runner = Runner(
-                agent=self.agents['host'],
-                app_name=self.app_name,
-                session_service=self.session_service
-            )
-            
-            query = f"Please translate this text to {target_language}: {text}"
-            content = types.Content(role='user', parts=[types.Part(text=query)])
-            
-            final_response = None
-            async for event in runner.run_async(
-                user_id="user_travel_planner",
-                session_id=f"translation_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                new_message=content
-            ):
-                if event.is_final_response():
-                    if event.content and event.content.parts:
-                        final_response = event.content.parts[0].text
-                    break
-            
-            return final_response or text  # Return original if translation fails
+            result = await translate_text(text, target_language, DirectToolContext())
+            if result.get('status') == 'success':
+                return result['translated_text']
+            return text  # Return original if translation fails
             
         except Exception as e:
             return text  # Return original text if translation fails
\ No newline at end of file
@@ -3,21 +3,190 @@ Multi-source Data Aggregation for ADK Agents
 Integrates events, local guides, restaurant reviews, attraction data
 """
 import asyncio
-import json
+import copy
+import logging
+import math
 import random
 import os
 import aiohttp
-from typing import Dict, List, Any, Optional
+import orjson
+from collections import defaultdict
+from itertools import islice
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from .tool_cache import cache_key, cache_get, cache_set
+
+logger = logging.getLogger(__name__)
+
+# How long aggregated destination data and individual source results are reused
+AGGREGATE_CACHE_TTL = 15 * 60
+SOURCE_CACHE_TTL = 10 * 60
+
+# One generator for all demo values (sample ratings, prices, fallback weather), kept apart from
+# the global random state so other code seeding or drawing from it doesn't affect these values
+_rng = random.Random()
+
+# Ticketmaster: events kept per classification, and the largest response body accepted
+_EVENTS_PER_CLASSIFICATION = 3
+_MAX_TICKETMASTER_PAYLOAD = 1024 * 1024
+
+# Sample sources only sleep to mimic upstream latency when explicitly asked to (e.g. for demos)
+_SIMULATE_LATENCY = os.getenv('AGGREGATOR_SIMULATE_LATENCY') == '1'
+
+# Sources whose results do not depend on the trip theme, so other themes can reuse them
+_THEME_INDEPENDENT_SOURCES = frozenset({'restaurants', 'local_guides', 'weather', 'transport', 'accommodation'})
+
+# Sources that call external APIs; only these take a slot of the aggregator's concurrency cap
+_NETWORK_SOURCES = frozenset({'events', 'weather'})
+
+# Approximate centres of the destinations offered in the planner, used to place sample items
+_CITY_CENTRES = {
+    'delhi': (28.6139, 77.2090),
+    'mumbai': (19.0760, 72.8777),
+    'goa': (15.4909, 73.8278),
+    'bangalore': (12.9716, 77.5946),
+    'rishikesh': (30.0869, 78.2676),
+    'jaipur': (26.9124, 75.7873),
+    'kerala': (9.9312, 76.2673),
+    'manali': (32.2432, 77.1892)
+}
+# Anchor for any other destination: sample items keep their relative spacing, so they still match each other
+_DEFAULT_CENTRE = (20.5937, 78.9629)
+
+# Shared read-only stand-in for missing nested objects in API payloads
+_NO_FIELDS: Mapping[str, Any] = MappingProxyType({})
+
+_GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+# Geohash cell sizes tried for "nearby", finest first: ~150 m, ~1.2 km, ~5 km
+_NEARBY_GEOHASH_PRECISIONS = (7, 6, 5)
+_WALKING_KM_PER_MINUTE = 0.08
+
+
+def _sample_position(destination: str, lat_offset: float, lon_offset: float) -> Dict[str, float]:
+    """Place a sample item at a fixed offset from the destination centre (or the default anchor)"""
+    centre = _CITY_CENTRES.get(destination.strip().lower(), _DEFAULT_CENTRE)
+    return {'lat': round(centre[0] + lat_offset, 5), 'lon': round(centre[1] + lon_offset, 5)}
+
+
+def _geohash(lat: float, lon: float, precision: int = max(_NEARBY_GEOHASH_PRECISIONS)) -> str:
+    """Encode a coordinate as a base32 geohash"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = bit_count = 0
+    use_lon = True
+    while len(chars) < precision:
+        value, value_range = (lon, lon_range) if use_lon else (lat, lat_range)
+        mid = (value_range[0] + value_range[1]) / 2
+        if value >= mid:
+            bits = bits * 2 + 1
+            value_range[0] = mid
+        else:
+            bits *= 2
+            value_range[1] = mid
+        use_lon = not use_lon
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = bit_count = 0
+    return ''.join(chars)
+
+
+def _distance_km(a: Dict[str, Any], b: Dict[str, Any]) -> float:
+    """Equirectangular distance between two items with lat/lon (accurate at city scale)"""
+    mean_lat = math.radians((a['lat'] + b['lat']) / 2)
+    dx = math.radians(b['lon'] - a['lon']) * math.cos(mean_lat)
+    dy = math.radians(b['lat'] - a['lat'])
+    return 6371.0 * math.hypot(dx, dy)
+
+
+def _has_position(item: Dict[str, Any]) -> bool:
+    """Whether an item carries lat/lon"""
+    return item.get('lat') is not None and item.get('lon') is not None
+
+
+def _build_geo_index(items: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Bucket items that have coordinates under each of their geohash prefixes"""
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for item in items:
+        if not _has_position(item):
+            continue
+        code = _geohash(item['lat'], item['lon'])
+        for precision in _NEARBY_GEOHASH_PRECISIONS:
+            index.setdefault(code[:precision], []).append(item)
+    return index
+
+
+def _nearest(index: Dict[str, List[Dict[str, Any]]], origin: Dict[str, Any], k: int) -> List[Tuple[float, Dict[str, Any]]]:
+    """
+    Up to k indexed items near origin as (distance_km, item), closest first
+    Walks from the finest geohash cell outwards until a cell holds at least k items
+    """
+    if not _has_position(origin):
+        return []
+    code = _geohash(origin['lat'], origin['lon'])
+    candidates: List[Dict[str, Any]] = []
+    for precision in _NEARBY_GEOHASH_PRECISIONS:
+        candidates = index.get(code[:precision], candidates)
+        if len(candidates) >= k:
+            break
+    return sorted(((_distance_km(origin, item), item) for item in candidates), key=lambda pair: pair[0])[:k]
+
+
+async def _simulated_latency(seconds: float) -> None:
+    """Sleep like a real upstream call would, only when AGGREGATOR_SIMULATE_LATENCY=1"""
+    if _SIMULATE_LATENCY:
+        await asyncio.sleep(seconds)
+
+
+def _canonical_theme(theme: Optional[str]) -> str:
+    """Normalize a user-supplied theme once at the aggregator boundary ('' or None means 'any')"""
+    return (theme or '').strip().lower() or 'any'
+
+
+async def gather_bounded(semaphore: asyncio.Semaphore, *coros) -> List[Any]:
+    """asyncio.gather(..., return_exceptions=True) with at most the semaphore's limit running at once"""
+    async def run(coro):
+        async with semaphore:
+            return await coro
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
 
 class MultiSourceDataAggregator:
     """
     Aggregates data from multiple sources for comprehensive travel recommendations
     """
     
-    def __init__(self):
+    # Shared, read-only weather advice handed out by the helpers below
+    _INDOOR_ALTERNATIVES = (
+        "Local museums and galleries",
+        "Shopping complexes",
+        "Indoor cultural centers",
+        "Spas and wellness centers"
+    )
+    _WEATHER_RECS = MappingProxyType({
+        'rain': (
+            "Pack waterproof clothing",
+            "Consider indoor activities",
+            "Use ride-sharing services"
+        ),
+        'hot': (
+            "Stay hydrated",
+            "Plan outdoor activities for early morning",
+            "Seek air-conditioned venues during peak hours"
+        ),
+        'cold': (
+            "Pack warm clothing",
+            "Consider hot beverages at local cafes",
+            "Indoor sightseeing recommended"
+        )
+    })
+    _DEFAULT_WEATHER_REC = ("Enjoy your travel!",)
+    
+    def __init__(self, max_source_concurrency: int = 4, max_api_concurrency: int = 3):
         self.data_sources = {
-            'events': EventsDataSource(),
+            'events': EventsDataSource(max_api_concurrency),
             'restaurants': RestaurantDataSource(),
             'attractions': AttractionsDataSource(),
             'local_guides': LocalGuidesDataSource(),
@@ -27,39 +196,77 @@ class MultiSourceDataAggregator:
             'accommodation': AccommodationDataSource()
         }
         
-        self.data_cache = {}
-        self.confidence_scores = {}
+        # One pooled HTTP session shared by every source, created lazily on first use
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Caps upstream source fetches in flight across all aggregations on this instance
+        self._source_semaphore = asyncio.Semaphore(max_source_concurrency)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                # Keep idle sockets around for a minute so the per-classification Ticketmaster calls
+                # and repeat aggregations reuse warm TLS connections instead of reconnecting
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300,
+                                               keepalive_timeout=60, enable_cleanup_closed=True),
+                timeout=aiohttp.ClientTimeout(total=10),
+                json_serialize=lambda value: orjson.dumps(value).decode()
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
         
     async def aggregate_destination_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
         """
         Aggregate comprehensive data for a destination
         """
+        # Sources and cache keys all see the canonical theme, so 'Cultural ' and 'cultural' share results
+        theme = _canonical_theme(theme)
+        aggregate_key = cache_key("aggregate_destination_data", destination=destination, theme=theme,
+                                  start_date=dates.get('startDate', ''), end_date=dates.get('endDate', ''))
+        cached = cache_get(aggregate_key)
+        if cached is not None:
+            return copy.deepcopy(cached)  # Callers and cross-referencing mutate nested items
+        
         aggregated_data = {
             'destination': destination,
             'theme': theme,
             'dates': dates,
             'data_sources_used': [],
+            'degraded_sources': [],  # Sources that answered with partly synthesized 'fallback' data
             'confidence_score': 0.0,
             'last_updated': datetime.now().isoformat()
         }
         
-        # Collect data from all sources
-        tasks = []
-        for source_name, source in self.data_sources.items():
-            task = self.fetch_from_source(source_name, source, destination, theme, dates)
-            tasks.append(task)
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Collect data from all sources at once; network sources are throttled inside fetch_from_source
+        session = await self._get_session()
+        results = await asyncio.gather(
+            *(self.fetch_from_source(source_name, source, session, destination, theme, dates)
+              for source_name, source in self.data_sources.items()),
+            return_exceptions=True
+        )
         
         # Process results
         for source_name, result in zip(self.data_sources.keys(), results):
             if isinstance(result, Exception):
-                print(f"Error from {source_name}: {result}")
+                logger.warning("[MULTI_SOURCE] Error from %s: %s", source_name, result)
                 continue
                 
             if result and result.get('success'):
                 aggregated_data[source_name] = result['data']
                 aggregated_data['data_sources_used'].append(source_name)
+                if result.get('fallback'):
+                    aggregated_data['degraded_sources'].append(source_name)
                 
         # Calculate overall confidence
         aggregated_data['confidence_score'] = self.calculate_confidence_score(aggregated_data)
@@ -67,16 +274,36 @@ class MultiSourceDataAggregator:
         # Cross-reference and enhance data
         enhanced_data = await self.cross_reference_data(aggregated_data)
         
+        # Cache only complete, non-fallback aggregates, so a failed or degraded source is retried on the next request
+        if (len(aggregated_data['data_sources_used']) == len(self.data_sources)
+                and not aggregated_data['degraded_sources']):
+            cache_set(aggregate_key, copy.deepcopy(enhanced_data), AGGREGATE_CACHE_TTL)
         return enhanced_data
     
-    async def fetch_from_source(self, source_name: str, source, destination: str, theme: str, dates: Dict[str, str]):
+    async def fetch_from_source(self, source_name: str, source, session: aiohttp.ClientSession,
+                                destination: str, theme: str, dates: Dict[str, str]):
         """
-        Fetch data from a single source with error handling
+        Fetch data from a single source with error handling, reusing recent successful results
+        Results flagged 'fallback' (partly synthesized after an upstream failure) are returned but not cached
         """
+        source_key = cache_key(f"source:{source_name}", destination=destination,
+                               theme='' if source_name in _THEME_INDEPENDENT_SOURCES else theme,
+                               start_date=dates.get('startDate', ''), end_date=dates.get('endDate', ''))
+        cached = cache_get(source_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
         try:
-            return await source.fetch_data(destination, theme, dates)
+            if source_name in _NETWORK_SOURCES:
+                async with self._source_semaphore:
+                    result = await source.fetch_data(session, destination, theme, dates)
+            else:
+                result = await source.fetch_data(session, destination, theme, dates)
+            if result and result.get('success') and not result.get('fallback'):
+                cache_set(source_key, copy.deepcopy(result), SOURCE_CACHE_TTL)
+            return result
         except Exception as e:
-            print(f"Error fetching from {source_name}: {e}")
+            logger.warning("[MULTI_SOURCE] Error fetching from %s: %s", source_name, e)
             return {'success': False, 'error': str(e)}
     
     def calculate_confidence_score(self, data: Dict[str, Any]) -> float:
@@ -89,14 +316,16 @@ class MultiSourceDataAggregator:
         # Base score from source diversity
         diversity_score = sources_count / max_sources
         
-        # Quality scores from individual sources
-        quality_scores = []
+        # Average quality of the individual sources, accumulated in one pass
+        quality_total = 0.0
+        quality_count = 0
         for source in data['data_sources_used']:
-            if source in data and isinstance(data[source], dict):
-                source_quality = data[source].get('quality_score', 0.5)
-                quality_scores.append(source_quality)
+            source_data = data.get(source)
+            if isinstance(source_data, dict):
+                quality_total += source_data.get('quality_score', 0.5)
+                quality_count += 1
         
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.5
+        avg_quality = quality_total / quality_count if quality_count else 0.5
         
         # Combined confidence
         confidence = (diversity_score * 0.4) + (avg_quality * 0.6)
@@ -105,33 +334,37 @@ class MultiSourceDataAggregator:
     async def cross_reference_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Cross-reference data between sources to enhance recommendations
+        Enhances data in place (the matchers and enhancers annotate its nested items) and returns it
         """
-        enhanced = data.copy()
+        # Nothing to integrate across a single source
+        if len(data['data_sources_used']) < 2:
+            data['integrated_suggestions'] = []
+            return data
         
         # Cross-reference restaurants with attractions (nearby dining)
         if 'restaurants' in data and 'attractions' in data:
-            enhanced['dining_near_attractions'] = self.match_restaurants_to_attractions(
+            data['dining_near_attractions'] = self.match_restaurants_to_attractions(
                 data['restaurants'], data['attractions']
             )
         
         # Cross-reference events with attractions (concurrent activities)
         if 'events' in data and 'attractions' in data:
-            enhanced['events_near_attractions'] = self.match_events_to_attractions(
+            data['events_near_attractions'] = self.match_events_to_attractions(
                 data['events'], data['attractions']
             )
         
         # Enhance with local guide insights
         if 'local_guides' in data:
-            enhanced = await self.enhance_with_local_insights(enhanced, data['local_guides'])
+            await self.enhance_with_local_insights(data, data['local_guides'])
         
         # Add weather-appropriate recommendations
         if 'weather' in data:
-            enhanced = self.add_weather_appropriate_suggestions(enhanced, data['weather'])
+            self.add_weather_appropriate_suggestions(data, data['weather'])
         
         # Create integrated itinerary suggestions
-        enhanced['integrated_suggestions'] = self.create_integrated_suggestions(enhanced)
+        data['integrated_suggestions'] = self.create_integrated_suggestions(data)
         
-        return enhanced
+        return data
     
     def match_restaurants_to_attractions(self, restaurants: Dict, attractions: Dict) -> List[Dict]:
         """
@@ -139,25 +372,36 @@ class MultiSourceDataAggregator:
         """
         matches = []
         restaurant_list = restaurants.get('items', [])
+        restaurant_index = _build_geo_index(restaurant_list)
+        unplaced_restaurants = [restaurant for restaurant in restaurant_list if not _has_position(restaurant)]
         attraction_list = attractions.get('items', [])
         
         for attraction in attraction_list:
-            nearby_restaurants = []
-            for restaurant in restaurant_list:
-                # Simulate proximity matching (in real implementation, use geolocation)
-                if random.random() > 0.7:  # 30% chance of being "nearby"
-                    nearby_restaurants.append({
-                        'name': restaurant.get('name'),
-                        'cuisine': restaurant.get('cuisine'),
-                        'rating': restaurant.get('rating'),
-                        'price_range': restaurant.get('price_range'),
-                        'distance': f"{random.randint(1, 10)} min walk"
-                    })
+            nearby = [
+                (restaurant, f"{max(1, round(distance / _WALKING_KM_PER_MINUTE))} min walk")
+                for distance, restaurant in _nearest(restaurant_index, attraction, 3)
+            ]
+            # Without coordinates on either side, fall back to simulated proximity
+            unplaced = unplaced_restaurants if _has_position(attraction) else restaurant_list
+            nearby.extend(
+                (restaurant, f"{_rng.randint(1, 10)} min walk")
+                for restaurant in unplaced if _rng.random() > 0.7  # 30% chance of being "nearby"
+            )
+            nearby_restaurants = [
+                {
+                    'name': restaurant.get('name'),
+                    'cuisine': restaurant.get('cuisine'),
+                    'rating': restaurant.get('rating'),
+                    'price_range': restaurant.get('price_range'),
+                    'distance': walk
+                }
+                for restaurant, walk in nearby[:3]  # Top 3
+            ]
             
             if nearby_restaurants:
                 matches.append({
                     'attraction': attraction.get('name'),
-                    'nearby_restaurants': nearby_restaurants[:3]  # Top 3
+                    'nearby_restaurants': nearby_restaurants
                 })
         
         return matches
@@ -168,25 +412,31 @@ class MultiSourceDataAggregator:
         """
         matches = []
         event_list = events.get('items', [])
+        event_index = _build_geo_index(event_list)
+        unplaced_events = [event for event in event_list if not _has_position(event)]
         attraction_list = attractions.get('items', [])
         
         for attraction in attraction_list:
-            concurrent_events = []
-            for event in event_list:
-                # Check if event is temporally and spatially relevant
-                if random.random() > 0.8:  # 20% chance of being relevant
-                    concurrent_events.append({
-                        'name': event.get('name'),
-                        'type': event.get('type'),
-                        'date': event.get('date'),
-                        'venue': event.get('venue'),
-                        'ticket_price': event.get('ticket_price')
-                    })
+            # Events are already limited to the trip dates, so only venue proximity is checked here
+            nearby = [event for _, event in _nearest(event_index, attraction, 2)]
+            # Venues without coordinates (or an unplaced attraction) fall back to simulated relevance
+            unplaced = unplaced_events if _has_position(attraction) else event_list
+            nearby.extend(event for event in unplaced if _rng.random() > 0.8)  # 20% chance of being relevant
+            concurrent_events = [
+                {
+                    'name': event.get('name'),
+                    'type': event.get('type'),
+                    'date': event.get('date'),
+                    'venue': event.get('venue'),
+                    'ticket_price': event.get('ticket_price')
+                }
+                for event in nearby[:2]  # Top 2
+            ]
             
             if concurrent_events:
                 matches.append({
                     'attraction': attraction.get('name'),
-                    'concurrent_events': concurrent_events[:2]  # Top 2
+                    'concurrent_events': concurrent_events
                 })
         
         return matches
@@ -195,14 +445,19 @@ class MultiSourceDataAggregator:
         """
         Enhance recommendations with local guide insights
         """
-        insights = local_guides.get('insights', [])
+        # Lowercase each insight location once rather than once per attraction
+        lowered_insights = [
+            (insight, insight.get('location', '').lower())
+            for insight in local_guides.get('insights', [])
+        ]
         
         # Add local tips to attractions
-        if 'attractions' in data:
+        if 'attractions' in data and lowered_insights:
             for attraction in data['attractions'].get('items', []):
+                attraction_name = attraction['name'].lower()
                 matching_insights = [
-                    insight for insight in insights 
-                    if attraction['name'].lower() in insight.get('location', '').lower()
+                    insight for insight, location in lowered_insights
+                    if attraction_name in location
                 ]
                 if matching_insights:
                     attraction['local_tips'] = matching_insights[:2]
@@ -237,35 +492,13 @@ class MultiSourceDataAggregator:
         
         return data
     
-    def get_indoor_alternatives(self) -> List[str]:
+    def get_indoor_alternatives(self) -> Tuple[str, ...]:
         """Get indoor alternatives for bad weather"""
-        return [
-            "Local museums and galleries",
-            "Shopping complexes",
-            "Indoor cultural centers",
-            "Spas and wellness centers"
-        ]
+        return self._INDOOR_ALTERNATIVES
     
-    def get_weather_specific_recommendations(self, condition: str) -> List[str]:
+    def get_weather_specific_recommendations(self, condition: str) -> Tuple[str, ...]:
         """Get weather-specific recommendations"""
-        recommendations = {
-            'rain': [
-                "Pack waterproof clothing",
-                "Consider indoor activities",
-                "Use ride-sharing services"
-            ],
-            'hot': [
-                "Stay hydrated",
-                "Plan outdoor activities for early morning",
-                "Seek air-conditioned venues during peak hours"
-            ],
-            'cold': [
-                "Pack warm clothing",
-                "Consider hot beverages at local cafes",
-                "Indoor sightseeing recommended"
-            ]
-        }
-        return recommendations.get(condition, ["Enjoy your travel!"])
+        return self._WEATHER_RECS.get(condition, self._DEFAULT_WEATHER_REC)
     
     def create_integrated_suggestions(self, data: Dict) -> List[Dict]:
         """
@@ -273,41 +506,32 @@ class MultiSourceDataAggregator:
         """
         suggestions = []
         
-        # Morning suggestions
-        morning_suggestion = {
-            'time_period': 'Morning (8:00 AM - 12:00 PM)',
-            'activities': []
-        }
+        # Group attractions and restaurants into time slots in a single pass each, keeping source order
+        attractions_by_slot = defaultdict(list)
+        for attr in data.get('attractions', {}).get('items', ()):
+            best_time = attr.get('best_time')
+            if best_time == 'morning':
+                attractions_by_slot['morning'].append(attr)
+            elif best_time in ('afternoon', 'any'):
+                attractions_by_slot['afternoon'].append(attr)
         
-        if 'attractions' in data:
-            morning_attractions = [
-                attr for attr in data['attractions'].get('items', [])
-                if attr.get('best_time') == 'morning'
-            ][:2]
-            morning_suggestion['activities'].extend(morning_attractions)
-        
-        if 'restaurants' in data:
-            breakfast_spots = [
-                rest for rest in data['restaurants'].get('items', [])
-                if 'breakfast' in rest.get('meal_types', [])
-            ][:1]
-            morning_suggestion['activities'].extend(breakfast_spots)
+        restaurants_by_meal = defaultdict(list)
+        for rest in data.get('restaurants', {}).get('items', ()):
+            for meal in rest.get('meal_types', ()):
+                restaurants_by_meal[meal].append(rest)
         
-        suggestions.append(morning_suggestion)
+        # Morning suggestions
+        suggestions.append({
+            'time_period': 'Morning (8:00 AM - 12:00 PM)',
+            'activities': attractions_by_slot['morning'][:2] + restaurants_by_meal['breakfast'][:1]
+        })
         
         # Afternoon suggestions
         afternoon_suggestion = {
             'time_period': 'Afternoon (12:00 PM - 6:00 PM)',
-            'activities': []
+            'activities': attractions_by_slot['afternoon'][:2]
         }
         
-        if 'attractions' in data:
-            afternoon_attractions = [
-                attr for attr in data['attractions'].get('items', [])
-                if attr.get('best_time') in ['afternoon', 'any']
-            ][:2]
-            afternoon_suggestion['activities'].extend(afternoon_attractions)
-        
         if 'dining_near_attractions' in data:
             lunch_options = data['dining_near_attractions'][:1]
             afternoon_suggestion['activities'].extend([
@@ -330,36 +554,129 @@ class MultiSourceDataAggregator:
             ][:1]
             evening_suggestion['activities'].extend(evening_events)
         
-        if 'restaurants' in data:
-            dinner_spots = [
-                rest for rest in data['restaurants'].get('items', [])
-                if 'dinner' in rest.get('meal_types', [])
-            ][:1]
-            evening_suggestion['activities'].extend(dinner_spots)
+        evening_suggestion['activities'].extend(restaurants_by_meal['dinner'][:1])
         
         suggestions.append(evening_suggestion)
         
         return suggestions
 
 
+def _event_identity(event: Dict[str, Any]) -> Any:
+    """Dedup key for a Ticketmaster event: its id, else (name, date, venue)"""
+    event_id = event.get('id')
+    if event_id:
+        return event_id
+    start = (event.get('dates') or _NO_FIELDS).get('start') or _NO_FIELDS
+    venues = (event.get('_embedded') or _NO_FIELDS).get('venues')
+    return (event.get('name'), start.get('localDate'), venues[0].get('name') if venues else None)
+
+
+def _format_event(event: Dict[str, Any], theme: str, default_date: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Flatten one Ticketmaster event into the aggregator's event shape, or None if it is malformed"""
+    try:
+        venue_name = "Venue TBA"
+        venue_position = {}
+        venues = (event.get('_embedded') or _NO_FIELDS).get('venues')
+        if venues:
+            venue = venues[0]
+            venue_name = venue.get('name', venue_name)
+            location = venue.get('location')
+            if location and location.get('latitude') and location.get('longitude'):
+                venue_position = {'lat': float(location['latitude']), 'lon': float(location['longitude'])}
+        
+        # Extract price info
+        price_info = "Price TBA"
+        ticket_price = 0
+        price_ranges = event.get('priceRanges')
+        if price_ranges:
+            price_range = price_ranges[0]
+            min_price = price_range.get('min', 0)
+            max_price = price_range.get('max', 0)
+            if min_price and max_price:
+                price_info = f"{price_range.get('currency', 'USD')} {min_price}-{max_price}"
+                ticket_price = int((min_price + max_price) / 2)
+        
+        start = (event.get('dates') or _NO_FIELDS).get('start') or _NO_FIELDS
+        
+        # Determine time of day from start time
+        time_period = 'evening'
+        start_time = start.get('localTime')
+        if start_time:
+            hour = int(start_time.split(':', 1)[0])
+            if 6 <= hour < 12:
+                time_period = 'morning'
+            elif 12 <= hour < 18:
+                time_period = 'afternoon'
+        
+        description = event.get('info')
+        if description is None:
+            description = event.get('pleaseNote', 'Event details available on booking')
+        
+        segment_name = 'General'
+        event_classifications = event.get('classifications')
+        if event_classifications:
+            segment_name = (event_classifications[0].get('segment') or _NO_FIELDS).get('name', segment_name)
+        
+        return {
+            'name': event.get('name', 'Unnamed Event'),
+            'type': theme,
+            'date': start.get('localDate', default_date),
+            'venue': venue_name,
+            'ticket_price': ticket_price,
+            'price_info': price_info,
+            'description': description,
+            'rating': round(_rng.uniform(4.0, 4.8), 1),  # Ticketmaster doesn't provide ratings
+            'time': time_period,
+            'url': event.get('url', ''),
+            'classification': segment_name,
+            'source': 'Ticketmaster',
+            **venue_position
+        }
+    except Exception as e:
+        logger.warning("[MULTI_SOURCE] Error processing event: %s", e)
+        return None
+
+
 class EventsDataSource:
     """Real Ticketmaster events data source"""
     
-    def __init__(self):
+    def __init__(self, max_api_concurrency: int = 3):
         self.api_key = os.getenv('TICKETMASTER_API_KEY')
+        # Caps concurrent Ticketmaster requests across classifications and aggregations
+        self._api_semaphore = asyncio.Semaphore(max_api_concurrency)
         self.base_url = "https://app.ticketmaster.com/discovery/v2"
         
-        # Theme classification mapping
+        # Theme classification mapping, keyed by canonical (lowercase) theme
         self.theme_mapping = {
-            'cultural': ['Arts & Theatre', 'Miscellaneous'],
-            'adventure': ['Sports'],
-            'spiritual': ['Miscellaneous'],
-            'luxury': ['Arts & Theatre', 'Music'],
-            'food': ['Miscellaneous'],
-            'any': ['Music', 'Sports', 'Arts & Theatre', 'Film', 'Miscellaneous']
+            'cultural': ('Arts & Theatre', 'Miscellaneous'),
+            'adventure': ('Sports',),
+            'spiritual': ('Miscellaneous',),
+            'luxury': ('Arts & Theatre', 'Music'),
+            'food': ('Miscellaneous',),
+            'any': ('Music', 'Sports', 'Arts & Theatre', 'Film', 'Miscellaneous')
         }
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+    async def _fetch_classification(self, session: aiohttp.ClientSession, params: Dict[str, Any],
+                                    classification: str) -> List[Dict[str, Any]]:
+        """Fetch the top 3 events for one Ticketmaster classification"""
+        search_params = params.copy()
+        search_params['classificationName'] = classification
+        search_params['size'] = _EVENTS_PER_CLASSIFICATION
+        
+        async with session.get(f"{self.base_url}/events.json", params=search_params) as response:
+            if response.status != 200:
+                return []
+            if (response.content_length or 0) > _MAX_TICKETMASTER_PAYLOAD:
+                logger.warning("[MULTI_SOURCE] Ticketmaster %s payload too large: %s bytes", classification, response.content_length)
+                return []
+            # Read to EOF so the keep-alive connection is released back to the pool
+            data = orjson.loads(await response.read())
+            return data.get('_embedded', {}).get('events', [])[:_EVENTS_PER_CLASSIFICATION]
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        # Resolved before any request so a retry reuses the same classification list
+        classifications = self.theme_mapping.get(_canonical_theme(theme), self.theme_mapping['any'])
+        
         if not self.api_key:
             return {
                 'success': False,
@@ -373,108 +690,62 @@ class EventsDataSource:
             }
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get classified genres for the theme
-                classifications = self.theme_mapping.get(theme, self.theme_mapping['any'])
-                
-                params = {
-                    'apikey': self.api_key,
-                    'city': destination,
-                    'size': 10,
-                    'sort': 'relevance,desc'
-                }
-                
-                # Add date range if provided
-                if dates.get('startDate'):
-                    params['startDateTime'] = f"{dates['startDate']}T00:00:00Z"
-                if dates.get('endDate'):
-                    params['endDateTime'] = f"{dates['endDate']}T23:59:59Z"
-                
-                all_events = []
-                
-                # Search for events in each classification
-                for classification in classifications:
-                    search_params = params.copy()
-                    search_params['classificationName'] = classification
-                    
-                    async with session.get(f"{self.base_url}/events.json", params=search_params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            if '_embedded' in data and 'events' in data['_embedded']:
-                                events = data['_embedded']['events']
-                                all_events.extend(events[:3])  # Take top 3 from each category
-                
-                # Process and format events
-                formatted_events = []
-                for event in all_events[:10]:  # Limit to 10 total events
-                    try:
-                        venue_name = "Venue TBA"
-                        if 'venues' in event.get('_embedded', {}):
-                            venue_name = event['_embedded']['venues'][0].get('name', venue_name)
-                        
-                        # Extract price info
-                        price_info = "Price TBA"
-                        ticket_price = 0
-                        if 'priceRanges' in event:
-                            min_price = event['priceRanges'][0].get('min', 0)
-                            max_price = event['priceRanges'][0].get('max', 0)
-                            currency = event['priceRanges'][0].get('currency', 'USD')
-                            if min_price and max_price:
-                                price_info = f"{currency} {min_price}-{max_price}"
-                                ticket_price = int((min_price + max_price) / 2)
-                        
-                        # Determine time of day from start time
-                        time_period = 'evening'
-                        if 'dates' in event and 'start' in event['dates']:
-                            start_time = event['dates']['start'].get('localTime', '')
-                            if start_time:
-                                hour = int(start_time.split(':')[0])
-                                if 6 <= hour < 12:
-                                    time_period = 'morning'
-                                elif 12 <= hour < 18:
-                                    time_period = 'afternoon'
-                                else:
-                                    time_period = 'evening'
-                        
-                        formatted_event = {
-                            'name': event.get('name', 'Unnamed Event'),
-                            'type': theme,
-                            'date': event.get('dates', {}).get('start', {}).get('localDate', dates.get('startDate')),
-                            'venue': venue_name,
-                            'ticket_price': ticket_price,
-                            'price_info': price_info,
-                            'description': event.get('info', event.get('pleaseNote', 'Event details available on booking')),
-                            'rating': round(random.uniform(4.0, 4.8), 1),  # Ticketmaster doesn't provide ratings
-                            'time': time_period,
-                            'url': event.get('url', ''),
-                            'classification': event.get('classifications', [{}])[0].get('segment', {}).get('name', 'General'),
-                            'source': 'Ticketmaster'
-                        }
-                        formatted_events.append(formatted_event)
-                    except Exception as e:
-                        print(f"Error processing event: {e}")
-                        continue
-                
-                if formatted_events:
-                    return {
-                        'success': True,
-                        'data': {
-                            'items': formatted_events,
-                            'total_count': len(formatted_events),
-                            'source': 'Ticketmaster API',
-                            'quality_score': 0.9
-                        }
-                    }
-                else:
-                    # No events found
-                    return {
-                        'events': [],
+            params = {
+                'apikey': self.api_key,
+                'city': destination,
+                'size': 10,
+                'sort': 'relevance,desc'
+            }
+            
+            # Add date range if provided
+            if dates.get('startDate'):
+                params['startDateTime'] = f"{dates['startDate']}T00:00:00Z"
+            if dates.get('endDate'):
+                params['endDateTime'] = f"{dates['endDate']}T23:59:59Z"
+            
+            # Search the classifications concurrently, a few at a time
+            results = await gather_bounded(
+                self._api_semaphore,
+                *(self._fetch_classification(session, params, classification) for classification in classifications)
+            )
+            
+            # Classifications overlap (an event can be both Music and Arts & Theatre), so keep the first copy
+            unique_events = {}
+            for classification, events in zip(classifications, results):
+                if isinstance(events, Exception):
+                    logger.warning("[MULTI_SOURCE] Ticketmaster %s search failed: %s", classification, events)
+                    continue
+                for event in events:
+                    unique_events.setdefault(_event_identity(event), event)
+            all_events = list(unique_events.values())[:10]  # Limit to 10 total events
+            
+            # Process and format events
+            default_date = dates.get('startDate')
+            formatted_events = [
+                formatted for formatted in (_format_event(event, theme, default_date) for event in all_events)
+                if formatted is not None
+            ]
+            
+            if formatted_events:
+                return {
+                    'success': True,
+                    'data': {
+                        'items': formatted_events,
+                        'total_count': len(formatted_events),
                         'source': 'Ticketmaster API',
-                        'message': 'No events found for the specified criteria'
+                        'quality_score': 0.9
                     }
-                    
+                }
+            else:
+                # No events found
+                return {
+                    'events': [],
+                    'source': 'Ticketmaster API',
+                    'message': 'No events found for the specified criteria'
+                }
+                
         except Exception as e:
-            print(f"[MULTI_SOURCE] Ticketmaster API error: {e}")
+            logger.error("[MULTI_SOURCE] Ticketmaster API error: %s", e)
             return {
                 'events': [],
                 'source': 'Ticketmaster API',
@@ -485,39 +756,45 @@ class EventsDataSource:
 class RestaurantDataSource:
     """Restaurant data source using real APIs"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        await asyncio.sleep(0.4)
+    _ALL_MEALS = ('breakfast', 'lunch', 'dinner')
+    _LUNCH_AND_DINNER = ('lunch', 'dinner')
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        await _simulated_latency(0.4)
         
         restaurants = [
             {
                 'name': f'Traditional {destination} Kitchen',
                 'cuisine': 'Local',
-                'rating': round(random.uniform(4.0, 4.8), 1),
+                'rating': round(_rng.uniform(4.0, 4.8), 1),
                 'price_range': '₹₹',
-                'meal_types': ['breakfast', 'lunch', 'dinner'],
+                'meal_types': self._ALL_MEALS,
                 'specialties': ['Local delicacies', 'Traditional sweets'],
                 'location': f'{destination} Old Town',
-                'avg_cost_per_person': random.randint(800, 1500)
+                **_sample_position(destination, 0.009, 0.005),
+                'avg_cost_per_person': _rng.randint(800, 1500)
             },
             {
                 'name': f'{destination} Rooftop Cafe',
                 'cuisine': 'Continental',
-                'rating': round(random.uniform(4.2, 4.9), 1),
+                'rating': round(_rng.uniform(4.2, 4.9), 1),
                 'price_range': '₹₹₹',
-                'meal_types': ['breakfast', 'lunch', 'dinner'],
+                'meal_types': self._ALL_MEALS,
                 'specialties': ['City views', 'International cuisine'],
                 'location': f'{destination} City Center',
-                'avg_cost_per_person': random.randint(1200, 2500)
+                **_sample_position(destination, -0.003, 0.005),
+                'avg_cost_per_person': _rng.randint(1200, 2500)
             },
             {
                 'name': f'{destination} Street Food Hub',
                 'cuisine': 'Street Food',
-                'rating': round(random.uniform(3.8, 4.5), 1),
+                'rating': round(_rng.uniform(3.8, 4.5), 1),
                 'price_range': '₹',
-                'meal_types': ['lunch', 'dinner'],
+                'meal_types': self._LUNCH_AND_DINNER,
                 'specialties': ['Authentic street food', 'Local snacks'],
                 'location': f'{destination} Market Area',
-                'avg_cost_per_person': random.randint(200, 600)
+                **_sample_position(destination, 0.011, 0.002),
+                'avg_cost_per_person': _rng.randint(200, 600)
             }
         ]
         
@@ -535,46 +812,50 @@ class RestaurantDataSource:
 class AttractionsDataSource:
     """Attractions data source using real tourism APIs"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        await asyncio.sleep(0.5)
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        await _simulated_latency(0.5)
         
         attractions = [
             {
                 'name': f'{destination} Historical Fort',
                 'type': 'historical',
-                'rating': round(random.uniform(4.3, 4.9), 1),
-                'entry_fee': random.randint(50, 300),
+                'rating': round(_rng.uniform(4.3, 4.9), 1),
+                'entry_fee': _rng.randint(50, 300),
                 'best_time': 'morning',
                 'duration': '2-3 hours',
                 'description': 'Ancient fort with rich historical significance',
                 'highlights': ['Architecture', 'Historical artifacts', 'Panoramic views'],
-                'location': f'{destination} Heritage District'
+                'location': f'{destination} Heritage District',
+                **_sample_position(destination, 0.010, 0.004)
             },
             {
                 'name': f'{destination} Art Gallery',
                 'type': 'cultural',
-                'rating': round(random.uniform(4.0, 4.6), 1),
-                'entry_fee': random.randint(100, 500),
+                'rating': round(_rng.uniform(4.0, 4.6), 1),
+                'entry_fee': _rng.randint(100, 500),
                 'best_time': 'afternoon',
                 'duration': '1-2 hours',
                 'description': 'Contemporary and traditional art exhibitions',
                 'highlights': ['Local artists', 'Contemporary art', 'Cultural exhibits'],
-                'location': f'{destination} Arts Quarter'
+                'location': f'{destination} Arts Quarter',
+                **_sample_position(destination, -0.004, 0.006)
             },
             {
                 'name': f'{destination} Adventure Park',
                 'type': 'adventure',
-                'rating': round(random.uniform(4.4, 4.8), 1),
-                'entry_fee': random.randint(800, 2000),
+                'rating': round(_rng.uniform(4.4, 4.8), 1),
+                'entry_fee': _rng.randint(800, 2000),
                 'best_time': 'any',
                 'duration': '4-5 hours',
                 'description': 'Thrilling adventure activities and sports',
                 'highlights': ['Zip lining', 'Rock climbing', 'Adventure sports'],
-                'location': f'{destination} Outskirts'
+                'location': f'{destination} Outskirts',
+                **_sample_position(destination, 0.060, -0.050)
             }
         ]
         
-        # Filter by theme
+        # Filter by theme (attraction types are stored lowercase)
+        theme = _canonical_theme(theme)
         if theme != 'any':
             attractions = [attr for attr in attractions if attr['type'] == theme]
         
@@ -592,8 +873,15 @@ class AttractionsDataSource:
 class LocalGuidesDataSource:
     """Local guides data source using real guide platforms"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        await asyncio.sleep(0.2)
+    _CUSTOMS = (
+        'Remove shoes before entering religious places',
+        'Dress modestly when visiting temples and heritage sites',
+        'Bargaining is expected in local markets',
+        'Try to learn basic local greetings - locals appreciate the effort'
+    )
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        await _simulated_latency(0.2)
         
         local_data = {
             'insights': [
@@ -628,12 +916,7 @@ class LocalGuidesDataSource:
                     'guide_rating': 4.7
                 }
             ],
-            'customs': [
-                'Remove shoes before entering religious places',
-                'Dress modestly when visiting temples and heritage sites',
-                'Bargaining is expected in local markets',
-                'Try to learn basic local greetings - locals appreciate the effort'
-            ]
+            'customs': self._CUSTOMS
         }
         
         return {
@@ -649,37 +932,40 @@ class LocalGuidesDataSource:
 class ReviewsDataSource:
     """Reviews aggregation source using real review platforms"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        await asyncio.sleep(0.3)
+    _COMMON_PRAISES = (
+        'Rich cultural heritage',
+        'Delicious local cuisine',
+        'Friendly locals',
+        'Good value for money'
+    )
+    _COMMON_CONCERNS = (
+        'Can get crowded during peak season',
+        'Limited English signage in some areas',
+        'Traffic congestion in city center'
+    )
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        await _simulated_latency(0.3)
         
         reviews_summary = {
-            'overall_rating': round(random.uniform(4.0, 4.8), 1),
-            'total_reviews': random.randint(500, 2000),
+            'overall_rating': round(_rng.uniform(4.0, 4.8), 1),
+            'total_reviews': _rng.randint(500, 2000),
             'recent_reviews': [
                 {
-                    'rating': random.randint(4, 5),
+                    'rating': _rng.randint(4, 5),
                     'comment': f'Amazing experience in {destination}! Highly recommend the local food.',
                     'traveler_type': 'Family',
                     'date': '2024-01-15'
                 },
                 {
-                    'rating': random.randint(4, 5),
+                    'rating': _rng.randint(4, 5),
                     'comment': f'Great destination for {theme} lovers. Well-organized attractions.',
                     'traveler_type': 'Solo',
                     'date': '2024-01-10'
                 }
             ],
-            'common_praises': [
-                'Rich cultural heritage',
-                'Delicious local cuisine',
-                'Friendly locals',
-                'Good value for money'
-            ],
-            'common_concerns': [
-                'Can get crowded during peak season',
-                'Limited English signage in some areas',
-                'Traffic congestion in city center'
-            ]
+            'common_praises': self._COMMON_PRAISES,
+            'common_concerns': self._COMMON_CONCERNS
         }
         
         return {
@@ -695,81 +981,88 @@ class ReviewsDataSource:
 class WeatherDataSource:
     """Real weather data source using OpenWeatherMap API"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        import aiohttp
-        import os
-        
+    @staticmethod
+    async def _get_json(session: aiohttp.ClientSession, url: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """GET url and return the decoded body, or None on a non-200 response"""
+        async with session.get(url, params=params) as response:
+            if response.status != 200:
+                return None
+            return orjson.loads(await response.read())
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
         API_KEY = os.getenv('OPENWEATHER_API_KEY', 'demo_key')
         BASE_URL = "http://api.openweathermap.org/data/2.5/weather"
         FORECAST_URL = "http://api.openweathermap.org/data/2.5/forecast"
         
         try:
             if API_KEY != 'demo_key':
-                async with aiohttp.ClientSession() as session:
-                    # Get current weather
-                    current_params = {
-                        'q': destination,
-                        'appid': API_KEY,
-                        'units': 'metric'
+                # Get current weather
+                current_params = {
+                    'q': destination,
+                    'appid': API_KEY,
+                    'units': 'metric'
+                }
+                
+                weather_data = {}
+                
+                # Current conditions and forecast are independent, so request both at once
+                data, forecast_data = await asyncio.gather(
+                    self._get_json(session, BASE_URL, current_params),
+                    self._get_json(session, FORECAST_URL, current_params)
+                )
+                
+                if data is not None:
+                    weather_data['current'] = {
+                        'condition': data['weather'][0]['description'],
+                        'temperature': data['main']['temp'],
+                        'humidity': data['main']['humidity'],
+                        'wind_speed': data.get('wind', {}).get('speed', 0)
                     }
-                    
-                    weather_data = {}
-                    
-                    async with session.get(BASE_URL, params=current_params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            weather_data['current'] = {
-                                'condition': data['weather'][0]['description'],
-                                'temperature': data['main']['temp'],
-                                'humidity': data['main']['humidity'],
-                                'wind_speed': data.get('wind', {}).get('speed', 0)
-                            }
-                        else:
-                            # API unavailable
-                            weather_data['current'] = {
-                                'condition': random.choice(['clear', 'cloudy', 'rain', 'sunny']),
-                                'temperature': random.randint(20, 35),
-                                'humidity': random.randint(40, 80)
-                            }
-                    
-                    # Get forecast data
-                    async with session.get(FORECAST_URL, params=current_params) as response:
-                        if response.status == 200:
-                            forecast_data = await response.json()
-                            weather_data['forecast'] = []
-                            
-                            # Process 5-day forecast (take first 5 days)
-                            for i in range(0, min(40, len(forecast_data['list'])), 8):  # Every 8th item = daily
-                                item = forecast_data['list'][i]
-                                weather_data['forecast'].append({
-                                    'date': dates.get('startDate') if i == 0 else item['dt_txt'][:10],
-                                    'condition': item['weather'][0]['description'],
-                                    'max_temp': item['main']['temp_max'],
-                                    'min_temp': item['main']['temp_min'],
-                                    'humidity': item['main']['humidity']
-                                })
-                        else:
-                            # Forecast unavailable
-                            weather_data['forecast'] = [
-                                {
-                                    'date': dates.get('startDate'),
-                                    'condition': random.choice(['clear', 'cloudy']),
-                                    'max_temp': random.randint(25, 32),
-                                    'min_temp': random.randint(18, 25)
-                                }
-                            ]
-                    
-                    return {
-                        'success': True,
-                        'data': {
-                            **weather_data,
-                            'source': 'OpenWeatherMap API',
-                            'quality_score': 0.95
+                else:
+                    # API unavailable
+                    weather_data['current'] = {
+                        'condition': _rng.choice(['clear', 'cloudy', 'rain', 'sunny']),
+                        'temperature': _rng.randint(20, 35),
+                        'humidity': _rng.randint(40, 80)
+                    }
+                
+                if forecast_data is not None:
+                    # Process 5-day forecast (take first 5 days): entries are 3-hourly, so every 8th is daily
+                    start_date = dates.get('startDate')
+                    weather_data['forecast'] = [
+                        {
+                            'date': start_date if i == 0 else item['dt_txt'][:10],
+                            'condition': item['weather'][0]['description'],
+                            'max_temp': (main := item['main'])['temp_max'],
+                            'min_temp': main['temp_min'],
+                            'humidity': main['humidity']
+                        }
+                        for i, item in enumerate(islice(forecast_data['list'], 0, 40, 8))
+                    ]
+                else:
+                    # Forecast unavailable
+                    weather_data['forecast'] = [
+                        {
+                            'date': dates.get('startDate'),
+                            'condition': _rng.choice(['clear', 'cloudy']),
+                            'max_temp': _rng.randint(25, 32),
+                            'min_temp': _rng.randint(18, 25)
                         }
+                    ]
+                
+                return {
+                    'success': True,
+                    # Placeholder values stood in for a failed call, so the result must not be cached
+                    'fallback': data is None or forecast_data is None,
+                    'data': {
+                        **weather_data,
+                        'source': 'OpenWeatherMap API',
+                        'quality_score': 0.95
                     }
+                }
             
         except Exception as e:
-            print(f"Weather API error: {e}")
+            logger.error("[MULTI_SOURCE] Weather API error: %s", e)
         
         # Return error if API is unavailable
         return {
@@ -787,31 +1080,26 @@ class WeatherDataSource:
 class TransportDataSource:
     """Transport data source using real transport APIs"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        await asyncio.sleep(0.4)
+    # (type, duration hours range, cost range, frequency, booking window)
+    _MODES = (
+        ('flight', (1, 4), (3000, 15000), 'Multiple daily', '2-3 weeks advance for best rates'),
+        ('train', (6, 24), (500, 3000), 'Daily', '2 months advance booking opens'),
+        ('bus', (8, 20), (800, 2500), 'Multiple daily', 'Same day booking available')
+    )
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        await _simulated_latency(0.4)
         
+        randint = _rng.randint
         transport_options = [
             {
-                'type': 'flight',
-                'duration': f'{random.randint(1, 4)} hours',
-                'cost': random.randint(3000, 15000),
-                'frequency': 'Multiple daily',
-                'booking_window': '2-3 weeks advance for best rates'
-            },
-            {
-                'type': 'train',
-                'duration': f'{random.randint(6, 24)} hours',
-                'cost': random.randint(500, 3000),
-                'frequency': 'Daily',
-                'booking_window': '2 months advance booking opens'
-            },
-            {
-                'type': 'bus',
-                'duration': f'{random.randint(8, 20)} hours',
-                'cost': random.randint(800, 2500),
-                'frequency': 'Multiple daily',
-                'booking_window': 'Same day booking available'
+                'type': mode,
+                'duration': f'{randint(*hours)} hours',
+                'cost': randint(*cost),
+                'frequency': frequency,
+                'booking_window': booking_window
             }
+            for mode, hours, cost, frequency, booking_window in self._MODES
         ]
         
         return {
@@ -827,28 +1115,27 @@ class TransportDataSource:
 class AccommodationDataSource:
     """Accommodation data source using real hotel APIs"""
     
-    async def fetch_data(self, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
-        await asyncio.sleep(0.5)
+    # (name suffix, type, rating range, nightly price range, amenities, location)
+    _LISTINGS = (
+        ('Heritage Hotel', 'hotel', (4.0, 4.8), (2000, 8000), ('WiFi', 'Restaurant', 'Pool', 'Spa'), 'City Center'),
+        ('Backpackers Hostel', 'hostel', (3.8, 4.5), (500, 1500), ('WiFi', 'Common Kitchen', 'Lounge'), 'Tourist Area')
+    )
+    
+    async def fetch_data(self, session: aiohttp.ClientSession, destination: str, theme: str, dates: Dict[str, str]) -> Dict[str, Any]:
+        await _simulated_latency(0.5)
         
+        uniform, randint = _rng.uniform, _rng.randint
         accommodations = [
             {
-                'name': f'{destination} Heritage Hotel',
-                'type': 'hotel',
-                'rating': round(random.uniform(4.0, 4.8), 1),
-                'price_per_night': random.randint(2000, 8000),
-                'amenities': ['WiFi', 'Restaurant', 'Pool', 'Spa'],
-                'location': 'City Center',
-                'availability': 'Available'
-            },
-            {
-                'name': f'{destination} Backpackers Hostel',
-                'type': 'hostel',
-                'rating': round(random.uniform(3.8, 4.5), 1),
-                'price_per_night': random.randint(500, 1500),
-                'amenities': ['WiFi', 'Common Kitchen', 'Lounge'],
-                'location': 'Tourist Area',
+                'name': f'{destination} {suffix}',
+                'type': kind,
+                'rating': round(uniform(*rating), 1),
+                'price_per_night': randint(*price),
+                'amenities': amenities,
+                'location': location,
                 'availability': 'Available'
             }
+            for suffix, kind, rating, price, amenities, location in self._LISTINGS
         ]
         
         return {
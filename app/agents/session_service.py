@@ -0,0 +1,58 @@
+"""
+Bounded in-memory session storage for the ADK runners
+Every planning request creates a session, so the stock InMemorySessionService grows without limit;
+this variant drops sessions that sit idle too long or exceed a count ceiling, least recently used first
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from google.adk.sessions import InMemorySessionService
+
+DEFAULT_MAX_SESSIONS = 1000
+DEFAULT_IDLE_TTL = 60 * 60  # seconds
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """InMemorySessionService with an LRU size cap and idle-time expiry"""
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, idle_ttl: float = DEFAULT_IDLE_TTL):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        # (app_name, user_id, session_id) -> last use, least recently used first
+        self._last_used: "OrderedDict[Tuple[str, str, str], float]" = OrderedDict()
+
+    def _touch(self, key: Tuple[str, str, str]) -> None:
+        self._last_used[key] = time.monotonic()
+        self._last_used.move_to_end(key)
+
+    async def _evict(self) -> None:
+        """Delete idle sessions and, past the cap, the least recently used ones"""
+        cutoff = time.monotonic() - self.idle_ttl
+        while self._last_used:
+            key, last_used = next(iter(self._last_used.items()))
+            if len(self._last_used) <= self.max_sessions and last_used > cutoff:
+                break
+            app_name, user_id, session_id = key
+            await self.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+    async def create_session(self, *, app_name: str, user_id: str, state: Optional[Dict[str, Any]] = None,
+                             session_id: Optional[str] = None, **kwargs):
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id, **kwargs
+        )
+        self._touch((app_name, user_id, session.id))
+        # Expired sessions are purged here rather than by a background task
+        await self._evict()
+        return session
+
+    async def get_session(self, *, app_name: str, user_id: str, session_id: str, **kwargs):
+        session = await super().get_session(app_name=app_name, user_id=user_id, session_id=session_id, **kwargs)
+        if session is not None:
+            self._touch((app_name, user_id, session_id))
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str, **kwargs):
+        self._last_used.pop((app_name, user_id, session_id), None)
+        return await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id, **kwargs)
@@ -0,0 +1,90 @@
+"""
+In-process TTL cache and request coalescing for ADK tool responses
+Keeps successful upstream results for a short window so repeat questions skip the network,
+and collapses identical concurrent calls into a single upstream request
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+# Per-tool time-to-live in seconds
+TOOL_CACHE_TTLS = {
+    "get_weather": 15 * 60,
+    "get_events_activities": 30 * 60,
+    "get_accommodation_options": 30 * 60,  # Matches the Amadeus hotel search cache
+    "get_transport_options": 10 * 60,
+    "translate_text": 24 * 60 * 60  # Same text and target always translate the same way
+}
+
+_MAX_ENTRIES = 512
+_cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+_lock = threading.RLock()
+
+
+def cache_key(tool_name: str, **kwargs) -> Tuple:
+    """Build a hashable cache key from a tool name and its normalized arguments"""
+    normalized = []
+    for name, value in sorted(kwargs.items()):
+        if isinstance(value, str):
+            value = value.strip().lower()
+        normalized.append((name, value))
+    return (tool_name, tuple(normalized))
+
+
+def cache_get(key: Hashable) -> Optional[Any]:
+    """Return the cached value for key, or None if missing or expired"""
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+        return value
+
+
+def cache_set(key: Hashable, value: Any, ttl: float) -> None:
+    """Store value under key for ttl seconds, evicting the oldest entries when full"""
+    with _lock:
+        _cache[key] = (time.monotonic() + ttl, value)
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+# Upstream calls currently in flight, keyed like the cache
+_inflight: Dict[Hashable, concurrent.futures.Future] = {}
+_inflight_lock = threading.Lock()
+
+
+async def singleflight(key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+    """
+    Run fetch() once for concurrent callers sharing a key
+    Returns the result and whether it was shared from another caller's in-flight call
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = concurrent.futures.Future()
+            _inflight[key] = future
+    
+    if not leader:
+        return await asyncio.wrap_future(future), True
+    
+    try:
+        result = await fetch()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    return result, False
@@ -0,0 +1,24 @@
+"""
+Google Cloud environment setup shared by the web app and the agents
+"""
+import functools
+import os
+from typing import Tuple
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def configure_env() -> Tuple[str, str, str]:
+    """Load .env and set the Google Cloud environment variables once; returns (project, location, credentials path)"""
+    load_dotenv()
+
+    project_id = os.getenv('VERTEX_PROJECT_ID', 'adroit-coral-472416-k2')
+    location = os.getenv('VERTEX_LOCATION', 'us-central1')
+    credentials_path = os.path.abspath(os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'credentials/adroit-coral-472416-k2-ff36978706d6.json'))
+
+    os.environ['GOOGLE_CLOUD_PROJECT'] = project_id
+    os.environ['GOOGLE_CLOUD_LOCATION'] = location
+    os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
+    os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = 'True'
+    return project_id, location, credentials_path
@@ -1,83 +1,104 @@
 from fastapi import FastAPI, Request, Form, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, List, Optional, AsyncGenerator
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Callable, Dict, List, Optional, AsyncGenerator
 from contextlib import asynccontextmanager
 import json
 import os
-from datetime import datetime, timedelta
+import orjson
 import random
+import secrets
+import time
 import logging
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from app.config import configure_env
 
-# Set up Google Cloud environment variables
-project_id = os.getenv('VERTEX_PROJECT_ID', 'adroit-coral-472416-k2')
-location = os.getenv('VERTEX_LOCATION', 'us-central1')
-credentials_path = os.path.abspath(os.getenv('GOOGLE_APPLICATION_CREDENTIALS', 'credentials/adroit-coral-472416-k2-ff36978706d6.json'))
-
-os.environ['GOOGLE_CLOUD_PROJECT'] = project_id
-os.environ['GOOGLE_CLOUD_LOCATION'] = location
-os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = credentials_path
-os.environ['GOOGLE_GENAI_USE_VERTEXAI'] = 'True'
+# Must run before the agent modules are imported: they read API keys at import time
+project_id, location, credentials_path = configure_env()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Log the configuration for debugging
-logger.info(f"[DEBUG] Google Cloud Project: {project_id}")
-logger.info(f"[DEBUG] Google Cloud Location: {location}")
-logger.info(f"[DEBUG] Credentials Path: {credentials_path}")
+logger.info("[DEBUG] Google Cloud Project: %s", project_id)
+logger.info("[DEBUG] Google Cloud Location: %s", location)
+logger.info("[DEBUG] Credentials Path: %s", credentials_path)
 
+import google.auth
 from app.agents.host_agent import HostAgent
+from app.agents.adk_framework import DirectToolContext, get_accommodation_options, get_transport_options
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager"""
     global host_agent
     logger.info("[STARTUP] Travel Planner ADK starting up...")
-    logger.info(f"[CONFIG] Using Google Cloud Project: {os.environ.get('GOOGLE_CLOUD_PROJECT')}")
-    logger.info(f"[CONFIG] Using Vertex AI: {os.environ.get('GOOGLE_GENAI_USE_VERTEXAI')}")
+    logger.info("[CONFIG] Using Google Cloud Project: %s", os.environ.get('GOOGLE_CLOUD_PROJECT'))
+    logger.info("[CONFIG] Using Vertex AI: %s", os.environ.get('GOOGLE_GENAI_USE_VERTEXAI'))
     
     try:
-        # Test basic authentication first
-        from google.cloud import storage
-        client = storage.Client()
+        # Test basic authentication first: resolve credentials without building an API client
+        google.auth.default()
         logger.info("[AUTH] Google Cloud authentication verified")
         
         # Initialize the Host Agent after environment is set up
-        from app.agents.host_agent import HostAgent
         host_agent = HostAgent()
         logger.info("[INIT] Google ADK agents initialized successfully")
     except Exception as e:
-        logger.error(f"[ERROR] Error initializing agents: {str(e)}")
+        logger.error("[ERROR] Error initializing agents: %s", e)
         raise HTTPException(status_code=500, detail="Failed to initialize travel planning agents")
     
     yield
     
-    # Cleanup (if needed)
+    # Cleanup: release the pooled HTTP connections shared across requests
     logger.info("[SHUTDOWN] Travel Planner ADK shutting down...")
+    from app.agents.adk_framework import close_http_session
+    from app.agents.multi_source_data import multi_source_aggregator
+    await close_http_session()
+    await multi_source_aggregator.close()
     host_agent = None
 
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson"""
+    
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+class ORJSONRoute(APIRoute):
+    """Route that hands its endpoint an ORJSONRequest, so request bodies skip the stdlib json decoder"""
+    
+    def get_route_handler(self) -> Callable:
+        original_route_handler = super().get_route_handler()
+        
+        async def orjson_route_handler(request: Request):
+            return await original_route_handler(ORJSONRequest(request.scope, request.receive))
+        
+        return orjson_route_handler
+
 app = FastAPI(
     title="Travel Planner ADK", 
     version="1.0.0", 
     description="AI-powered travel planner using Google ADK",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
+# Must be set before the routes below are declared
+app.router.route_class = ORJSONRoute
 
-# Add CORS middleware
+# Add CORS middleware. The bundled pages are same-origin and send no cookies, so credentials stay off:
+# with a wildcard origin Starlette then sends a fixed "*" instead of echoing and varying on each Origin
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
+    allow_origins=[origin.strip() for origin in os.getenv('FRONTEND_ORIGINS', '*').split(',')],
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
 
@@ -88,7 +109,38 @@ templates = Jinja2Templates(directory="templates")
 # Initialize the Host Agent
 host_agent = None
 
+# Destination and theme catalogs never change at runtime, so they are serialized once at import
+DESTINATIONS_BODY = orjson.dumps({"destinations": [
+    {"name": "Delhi", "description": "Capital city with rich history"},
+    {"name": "Mumbai", "description": "Financial capital and Bollywood hub"},
+    {"name": "Goa", "description": "Beach paradise with Portuguese heritage"},
+    {"name": "Bangalore", "description": "Silicon Valley of India"},
+    {"name": "Rishikesh", "description": "Yoga capital of the world"},
+    {"name": "Jaipur", "description": "Pink city with royal heritage"},
+    {"name": "Kerala", "description": "God's own country with backwaters"},
+    {"name": "Manali", "description": "Hill station in the Himalayas"}
+]})
+THEMES_BODY = orjson.dumps({"themes": [
+    {"name": "adventure", "description": "Thrilling outdoor activities and sports"},
+    {"name": "spiritual", "description": "Meditation, yoga, and spiritual experiences"},
+    {"name": "luxury", "description": "Premium accommodations and fine dining"},
+    {"name": "cultural", "description": "Heritage sites and local traditions"},
+    {"name": "beach", "description": "Coastal relaxation and water sports"},
+    {"name": "mountain", "description": "Hill stations and mountain adventures"}
+]})
+STATIC_CATALOG_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+# Frontend keys come from the environment loaded at startup and don't change while running
+API_KEYS_BODY = orjson.dumps({
+    "weather_key": os.getenv('OPENWEATHER_API_KEY'),
+    "events_key": os.getenv('TICKETMASTER_API_KEY'),
+    "google_maps_key": os.getenv('GOOGLE_MAPS_KEY')
+})
+API_KEYS_HEADERS = {"Cache-Control": "private, max-age=300"}
+
 class TravelRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     budget: float
     duration: int  # days
     theme: str
@@ -100,15 +152,17 @@ class TravelRequest(BaseModel):
     travelers: int = 1  # Number of travelers
     selectedFlight: Optional[Dict] = None  # Selected flight details
     selectedHotel: Optional[Dict] = None   # Selected hotel details
-    selectedFlight: Optional[Dict] = None  # Selected flight details
-    selectedHotel: Optional[Dict] = None   # Selected hotel details
 
 class BookingRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     itinerary_id: str
     user_info: Dict
     payment_info: Dict
 
 class TranslationRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     text: str
     target_language: str
 
@@ -152,15 +206,16 @@ async def final_booking(request: Request):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # Epoch seconds: liveness probes poll this often and only need the status
+    return ORJSONResponse({"status": "healthy", "timestamp": time.time()})
 
 @app.post("/api/generate-itinerary")
 async def generate_itinerary(travel_request: TravelRequest):
     """Generate a travel itinerary using Google ADK agents"""
     try:
-        logger.info(f"[REQUEST] Generating itinerary for {travel_request.destination}, theme: {travel_request.theme}")
-        logger.info(f"[REQUEST] Budget: {travel_request.budget}, Duration: {travel_request.duration} days")
-        logger.info(f"[REQUEST] Travelers: {travel_request.travelers}, From: {travel_request.fromCity}")
+        logger.info("[REQUEST] Generating itinerary for %s, theme: %s", travel_request.destination, travel_request.theme)
+        logger.info("[REQUEST] Budget: %s, Duration: %s days", travel_request.budget, travel_request.duration)
+        logger.info("[REQUEST] Travelers: %s, From: %s", travel_request.travelers, travel_request.fromCity)
         
         if host_agent is None:
             logger.error("[ERROR] Host agent not initialized")
@@ -168,30 +223,50 @@ async def generate_itinerary(travel_request: TravelRequest):
         
         itinerary = await host_agent.orchestrate_trip_planning(travel_request.model_dump())
         logger.info("[SUCCESS] Itinerary generated successfully")
-        logger.info(f"[RESPONSE] ADK Response type: {type(itinerary)}")
-        logger.info(f"[RESPONSE] ADK Response keys: {itinerary.keys() if isinstance(itinerary, dict) else 'Not a dict'}")
+        logger.info("[RESPONSE] ADK Response type: %s", type(itinerary))
+        logger.info("[RESPONSE] ADK Response keys: %s", itinerary.keys() if isinstance(itinerary, dict) else 'Not a dict')
         
         # Ensure the response has the expected structure
         if not isinstance(itinerary, dict):
             logger.warning("[WARNING] ADK response is not a dict, converting...")
             itinerary = {"itinerary": str(itinerary), "message": "Generated itinerary"}
         
-        # Add session_id if not present
-        if 'session_id' not in itinerary:
-            itinerary['session_id'] = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Add session_id if not present (random, so requests in the same second don't collide)
+        itinerary.setdefault('session_id', f"session_{secrets.token_hex(8)}")
         
-        return JSONResponse(content=itinerary)
+        return ORJSONResponse(content=itinerary)
     except Exception as e:
-        logger.error(f"[ERROR] Error generating itinerary: {str(e)}")
-        return JSONResponse(content={"error": str(e), "success": False}, status_code=500)
+        logger.error("[ERROR] Error generating itinerary: %s", e)
+        return ORJSONResponse(content={"error": str(e), "success": False}, status_code=500)
+
+@app.post("/api/generate-itinerary/stream")
+async def generate_itinerary_stream(travel_request: TravelRequest):
+    """Stream the itinerary text as it is generated so the page can render before the whole plan is ready"""
+    logger.info("[REQUEST] Streaming itinerary for %s, theme: %s", travel_request.destination, travel_request.theme)
+    
+    if host_agent is None:
+        logger.error("[ERROR] Host agent not initialized")
+        return ORJSONResponse(content={"error": "Travel planning service unavailable", "success": False}, status_code=500)
+    
+    async def chunks() -> AsyncGenerator[str, None]:
+        # Starlette iterates the body in one task, which keeps the ADK generator (and its tracing context) in that task
+        try:
+            async for chunk in host_agent.orchestrate_trip_planning_stream(travel_request.model_dump()):
+                yield chunk
+        except Exception as e:
+            # The 200 status has already been sent, so end with a marker line the client can detect
+            logger.error("[ERROR] Error streaming itinerary: %s", e)
+            yield f"\n[STREAM_ERROR] {e}\n"
+    
+    return StreamingResponse(chunks(), media_type="text/plain; charset=utf-8")
 
 @app.post("/api/book-trip")
 async def book_trip(booking_request: BookingRequest):
     """Handle trip booking using booking agent"""
     try:
-        logger.info(f"[BOOKING] Processing booking for itinerary: {booking_request.itinerary_id}")
-        logger.info(f"[BOOKING] User info: {len(booking_request.user_info)} fields provided")
-        logger.info(f"[BOOKING] Payment info: {len(booking_request.payment_info)} fields provided")
+        logger.info("[BOOKING] Processing booking for itinerary: %s", booking_request.itinerary_id)
+        logger.info("[BOOKING] User info: %s fields provided", len(booking_request.user_info))
+        logger.info("[BOOKING] Payment info: %s fields provided", len(booking_request.payment_info))
         
         if host_agent is None:
             logger.error("[ERROR] Host agent not initialized")
@@ -199,16 +274,16 @@ async def book_trip(booking_request: BookingRequest):
         
         booking_result = await host_agent.handle_booking(booking_request.model_dump())
         logger.info("[SUCCESS] Booking processed successfully")
-        return JSONResponse(content=booking_result)
+        return ORJSONResponse(content=booking_result)
     except Exception as e:
-        logger.error(f"[ERROR] Error processing booking: {str(e)}")
-        return JSONResponse(content={"error": str(e), "success": False}, status_code=500)
+        logger.error("[ERROR] Error processing booking: %s", e)
+        return ORJSONResponse(content={"error": str(e), "success": False}, status_code=500)
 
 @app.get("/api/weather-update/{itinerary_id}")
 async def weather_update(itinerary_id: str):
     """Get weather updates that might affect itinerary"""
     try:
-        logger.info(f"[WEATHER] Checking weather updates for session: {itinerary_id}")
+        logger.info("[WEATHER] Checking weather updates for session: %s", itinerary_id)
         
         if host_agent is None:
             logger.error("[ERROR] Host agent not initialized")
@@ -216,17 +291,17 @@ async def weather_update(itinerary_id: str):
         
         update = await host_agent.check_weather_updates(itinerary_id)
         logger.info("[SUCCESS] Weather update retrieved")
-        return JSONResponse(content=update)
+        return ORJSONResponse(content=update)
     except Exception as e:
-        logger.error(f"[ERROR] Error getting weather update: {str(e)}")
-        return JSONResponse(content={"error": str(e), "success": False}, status_code=500)
+        logger.error("[ERROR] Error getting weather update: %s", e)
+        return ORJSONResponse(content={"error": str(e), "success": False}, status_code=500)
 
 @app.post("/api/translate")
 async def translate_text(translation_request: TranslationRequest):
     """Translate text between English and Hindi"""
     try:
-        logger.info(f"[TRANSLATE] Translating text to {translation_request.target_language}")
-        logger.info(f"[TRANSLATE] Text length: {len(translation_request.text)} characters")
+        logger.info("[TRANSLATE] Translating text to %s", translation_request.target_language)
+        logger.info("[TRANSLATE] Text length: %s characters", len(translation_request.text))
         
         if host_agent is None:
             logger.error("[ERROR] Host agent not initialized")
@@ -234,47 +309,25 @@ async def translate_text(translation_request: TranslationRequest):
         
         translated = await host_agent.translate_text(translation_request.text, translation_request.target_language)
         logger.info("[SUCCESS] Text translated successfully")
-        return JSONResponse(content={"translated_text": translated, "success": True})
+        return ORJSONResponse(content={"translated_text": translated, "success": True})
     except Exception as e:
-        logger.error(f"[ERROR] Error translating text: {str(e)}")
-        return JSONResponse(content={"error": str(e), "success": False}, status_code=500)
+        logger.error("[ERROR] Error translating text: %s", e)
+        return ORJSONResponse(content={"error": str(e), "success": False}, status_code=500)
 
 @app.get("/api/destinations")
 async def get_destinations():
     """Get available destinations"""
-    destinations = [
-        {"name": "Delhi", "description": "Capital city with rich history"},
-        {"name": "Mumbai", "description": "Financial capital and Bollywood hub"},
-        {"name": "Goa", "description": "Beach paradise with Portuguese heritage"},
-        {"name": "Bangalore", "description": "Silicon Valley of India"},
-        {"name": "Rishikesh", "description": "Yoga capital of the world"},
-        {"name": "Jaipur", "description": "Pink city with royal heritage"},
-        {"name": "Kerala", "description": "God's own country with backwaters"},
-        {"name": "Manali", "description": "Hill station in the Himalayas"}
-    ]
-    return JSONResponse(content={"destinations": destinations})
+    return Response(content=DESTINATIONS_BODY, media_type="application/json", headers=STATIC_CATALOG_HEADERS)
 
 @app.get("/api/themes")
 async def get_themes():
     """Get available travel themes"""
-    themes = [
-        {"name": "adventure", "description": "Thrilling outdoor activities and sports"},
-        {"name": "spiritual", "description": "Meditation, yoga, and spiritual experiences"},
-        {"name": "luxury", "description": "Premium accommodations and fine dining"},
-        {"name": "cultural", "description": "Heritage sites and local traditions"},
-        {"name": "beach", "description": "Coastal relaxation and water sports"},
-        {"name": "mountain", "description": "Hill stations and mountain adventures"}
-    ]
-    return JSONResponse(content={"themes": themes})
+    return Response(content=THEMES_BODY, media_type="application/json", headers=STATIC_CATALOG_HEADERS)
 
 @app.get("/api/config/api-keys")
 async def get_api_keys():
     """Get API keys for frontend (only non-sensitive keys)"""
-    return JSONResponse(content={
-        "weather_key": os.getenv('OPENWEATHER_API_KEY'),
-        "events_key": os.getenv('TICKETMASTER_API_KEY'),
-        "google_maps_key": os.getenv('GOOGLE_MAPS_KEY')
-    })
+    return Response(content=API_KEYS_BODY, media_type="application/json", headers=API_KEYS_HEADERS)
 
 
 
@@ -287,77 +340,60 @@ async def not_found_handler(request: Request, exc: HTTPException):
 async def get_transport_options_api(request: dict):
     """Get real transport options from Amadeus API"""
     try:
-        logger.info(f"[TRANSPORT] Getting transport options: {request}")
+        logger.info("[TRANSPORT] Getting transport options: %s", request)
         
         origin = request.get('origin', 'Delhi')
         destination = request.get('destination', 'Goa')
         travel_date = request.get('travel_date', '2025-10-01')
         transport_type = request.get('transport_type', 'flight')
         
-        logger.info(f"[TRANSPORT] Origin: {origin}, Destination: {destination}, Date: {travel_date}")
+        logger.info("[TRANSPORT] Origin: %s, Destination: %s, Date: %s", origin, destination, travel_date)
         
         if host_agent is None:
             logger.error("[ERROR] Host agent not initialized")
             raise HTTPException(status_code=500, detail="Transport service unavailable")
         
         # Use the transport agent to get real data
-        from app.agents.adk_framework import get_transport_options
-        from app.agents.adk_framework import ToolContext
-        
-        class MockContext:
-            def __init__(self):
-                self.state = {}
-        
-        mock_context = MockContext()
-        transport_result = get_transport_options(origin, destination, travel_date, mock_context)
+        transport_result = await get_transport_options(origin, destination, travel_date, DirectToolContext())
         
         logger.info("[SUCCESS] Transport options retrieved successfully")
-        return JSONResponse(content=transport_result)
+        return ORJSONResponse(content=transport_result)
         
     except Exception as e:
-        logger.error(f"[ERROR] Error getting transport options: {str(e)}")
-        import traceback
-        logger.error(f"[ERROR] Traceback: {traceback.format_exc()}")
-        return JSONResponse(content={"error": str(e), "success": False}, status_code=500)
+        logger.exception("[ERROR] Error getting transport options: %s", e)
+        return ORJSONResponse(content={"error": str(e), "success": False}, status_code=500)
 
 @app.post("/api/get-accommodation-options")
 async def get_accommodation_options_api(request: dict):
     """Get real accommodation options from Amadeus API"""
     try:
-        logger.info(f"[ACCOMMODATION] Getting accommodation options: {request}")
+        logger.info("[ACCOMMODATION] Getting accommodation options: %s", request)
         
         city = request.get('city', 'Goa')
         checkin_date = request.get('checkin_date', '2025-10-01')
         checkout_date = request.get('checkout_date', '2025-10-08')
         budget_range = request.get('budget_range', 'mid-range')
         
-        logger.info(f"[ACCOMMODATION] City: {city}, Check-in: {checkin_date}, Check-out: {checkout_date}, Budget: {budget_range}")
+        logger.info("[ACCOMMODATION] City: %s, Check-in: %s, Check-out: %s, Budget: %s", city, checkin_date, checkout_date, budget_range)
         
         if host_agent is None:
             logger.error("[ERROR] Host agent not initialized")
             raise HTTPException(status_code=500, detail="Accommodation service unavailable")
         
         # Use the accommodation agent to get real data
-        from app.agents.adk_framework import get_accommodation_options
-        
-        class MockContext:
-            def __init__(self):
-                self.state = {}
-        
-        mock_context = MockContext()
-        accommodation_result = get_accommodation_options(city, checkin_date, checkout_date, budget_range, mock_context)
+        accommodation_result = await get_accommodation_options(city, checkin_date, checkout_date, budget_range, DirectToolContext())
         
         logger.info("[SUCCESS] Accommodation options retrieved successfully")
-        return JSONResponse(content=accommodation_result)
+        return ORJSONResponse(content=accommodation_result)
         
     except Exception as e:
-        logger.error(f"[ERROR] Error getting accommodation options: {str(e)}")
-        return JSONResponse(content={"error": str(e), "success": False}, status_code=500)
+        logger.error("[ERROR] Error getting accommodation options: %s", e)
+        return ORJSONResponse(content={"error": str(e), "success": False}, status_code=500)
 
 @app.exception_handler(500)
 async def server_error_handler(request: Request, exc: HTTPException):
     """Custom 500 handler"""
-    return JSONResponse(
+    return ORJSONResponse(
         content={"error": "Internal server error", "success": False},
         status_code=500
     )
@@ -365,4 +401,13 @@ async def server_error_handler(request: Request, exc: HTTPException):
 if __name__ == "__main__":
     import uvicorn
     logger.info("[SERVER] Starting Travel Planner ADK server...")
-    uvicorn.run(app, host="127.0.0.1", port=8080, log_level="info")
\ No newline at end of file
+    # loop/http stay on "auto", which picks uvloop and httptools from uvicorn[standard] where available.
+    # Trip sessions live in process memory, so extra workers only suit deployments with sticky routing.
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8080,
+        workers=int(os.getenv("WORKERS", "1")),
+        log_level="info",
+        access_log=False
+    )
\ No newline at end of file